@@ -31,6 +31,22 @@ from mcp.types import (
 # Local imports (will be implemented)
 from ai_memory_core import PersistentAIMemorySystem
 
+# Optional C-level JSON encoder for response serialization; history and
+# search results carry many rows, where orjson is several times faster
+# than the stdlib encoder
+try:
+    import orjson
+
+    # OPT_NON_STR_KEYS matches the stdlib fallback, which coerces
+    # non-string dict keys instead of raising
+    def _result_to_text(result) -> str:
+        return orjson.dumps(
+            result, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+except ImportError:
+    def _result_to_text(result) -> str:
+        return json.dumps(result, indent=2, default=str)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -635,7 +651,7 @@ class AIMemoryMCPServer:
             
             # Format the result as a proper TextContent object
             if isinstance(result, (dict, list)):
-                result_text = json.dumps(result, indent=2, default=str)
+                result_text = _result_to_text(result)
             else:
                 result_text = str(result)
             
@@ -53,6 +53,7 @@ For usage examples and integration guides, see the documentation in /docs.
 """
 
 import asyncio
+import atexit
 import sqlite3
 import json
 import uuid
@@ -62,26 +63,101 @@ import numpy as np
 import hashlib
 import os
 import re
+import threading
 import time
 import socket
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime, timezone, timedelta, tzinfo
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
-# Get local timezone
+# Get local timezone (resolved once - timezone detection is not free and the
+# result cannot change within a process)
+_LOCAL_TZ = None
+
 def get_local_timezone() -> ZoneInfo:
     """Get local timezone based on system settings"""
-    try:
-        import time
-        return ZoneInfo(time.tzname[0])
-    except:
-        # Fallback to a common timezone if detection fails
-        return ZoneInfo("America/Chicago")  # Central Time fallback
-    
+    global _LOCAL_TZ
+    if _LOCAL_TZ is None:
+        try:
+            import time
+            _LOCAL_TZ = ZoneInfo(time.tzname[0])
+        except:
+            # Fallback to a common timezone if detection fails
+            _LOCAL_TZ = ZoneInfo("America/Chicago")  # Central Time fallback
+    return _LOCAL_TZ
+
+# Entropy pool for record IDs: one getrandom syscall hands out 1024 IDs.
+_ID_POOL_REFILL = 16384
+_id_pool = bytearray()
+_id_pool_lock = threading.Lock()
+
+def _new_record_id() -> str:
+    """Generate a random record ID for the hot insert paths.
+
+    128 bits of randomness like uuid.uuid4(), but without the UUID object
+    construction, and the entropy comes from a preallocated pool refilled
+    16KB at a time - one os.urandom syscall amortized over 1024 IDs instead
+    of one per row, which adds up at thousands of inserts per second.
+    """
+    global _id_pool
+    with _id_pool_lock:
+        if len(_id_pool) < 16:
+            _id_pool = bytearray(os.urandom(_ID_POOL_REFILL))
+        raw = bytes(_id_pool[-16:])
+        del _id_pool[-16:]
+    return raw.hex()
+
+def _content_hash(*parts) -> bytes:
+    """Hash a duplicate-detection key down to 16 bytes.
+
+    BLAKE2b-128 over the same fields the old pre-insert SELECTs compared,
+    so equality on the hash is equality on the key (None is encoded
+    distinctly from the string "None"). Comparing 16-byte blobs in a UNIQUE
+    index is far cheaper than comparing full content strings in a scan.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        if part is None:
+            h.update(b"\x00")
+        else:
+            h.update(str(part).encode("utf-8"))
+        h.update(b"\x1f")
+    return h.digest()
+
+# Last formatted timestamp, reused for calls landing within the same
+# millisecond. Writes call this two or three times per row (and once per row
+# in bulk loops); the datetime construction plus isoformat dominate, and
+# row timestamps don't need sub-millisecond resolution.
+_ts_cache = (0.0, "")
+
 def get_current_timestamp() -> str:
     """Get current timestamp in local timezone ISO format"""
-    return datetime.now(get_local_timezone()).isoformat()
+    global _ts_cache
+    now = time.time()
+    if now - _ts_cache[0] < 0.001:
+        return _ts_cache[1]
+    value = datetime.now(get_local_timezone()).isoformat()
+    _ts_cache = (now, value)
+    return value
+
+# Today's local date string, cached until the day rolls over. The stats
+# UPSERT needs it on every single log call and recomputing it via
+# datetime.now().date().isoformat() is pure waste between midnights.
+_today_cache = ("", 0.0)
+
+def _today_local() -> str:
+    """Get today's date in the local timezone as an ISO string (cached)"""
+    global _today_cache
+    now = time.time()
+    if now >= _today_cache[1]:
+        local_now = datetime.now(get_local_timezone())
+        next_midnight = (local_now + timedelta(days=1)).replace(
+            hour=0, minute=0, second=0, microsecond=0)
+        _today_cache = (local_now.date().isoformat(), next_midnight.timestamp())
+    return _today_cache[0]
     
 def datetime_to_local_isoformat(dt: datetime) -> str:
     """Convert any datetime to local timezone ISO format"""
@@ -110,6 +186,38 @@ from pathlib import Path
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+# Optional C-level JSON encoder for the hot insert paths
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional C-level ISO 8601 parser for bulk timestamp parsing
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = datetime.fromisoformat
+
+def _json_dumps(obj) -> str:
+    """Serialize a value to compact JSON text for storage.
+
+    Uses orjson when installed (C-level, several times faster than stdlib)
+    and compact separators otherwise, so stored rows carry no whitespace
+    padding. Values stay TEXT rather than BLOB because history APIs and the
+    maintenance scripts read these columns back as JSON text.
+
+    SQLite 3.45's JSONB encoding was considered and rejected: it only pays
+    off for json_extract()-style queries (none exist here - every read path
+    json.loads() the whole value in Python), and it would require a newer
+    SQLite than many bundled interpreters ship.
+    """
+    if orjson is not None:
+        # OPT_NON_STR_KEYS matches stdlib behavior, which coerces int/float
+        # dict keys to strings instead of raising - whether a metadata dict
+        # stores must not depend on which encoder is installed
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"))
+
 # Configure logging with minimal output
 logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
@@ -117,42 +225,502 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.WARNING)
 
 
+# Size of sqlite3's per-connection statement cache. The default (128) is
+# bumped so the hot-path INSERT/UPDATE statements stay prepared across calls
+# instead of being re-parsed and re-planned each time.
+_STATEMENT_CACHE_SIZE = 512
+
+# Hot-path SQL as module-level constants so every call passes the identical
+# string object and hits the connection's statement cache on its identity
+# fast path. Kept as single-line strings (no leading whitespace) to minimize
+# the bytes handed to the SQLite parser on a cache miss.
+_INSERT_TOOL_CALL_SQL = (
+    "INSERT INTO tool_calls (call_id, timestamp, client_id, tool_name, parameters, result, "
+    "status, execution_time_ms, error_message) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+_INSERT_MESSAGE_SQL = (
+    "INSERT INTO messages (message_id, conversation_id, timestamp, role, content, metadata, "
+    "content_hash) VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+_UPSERT_TOOL_STATS_SQL = (
+    "INSERT INTO tool_usage_stats (stat_id, tool_name, date, call_count, success_count, "
+    "error_count, avg_execution_time_ms) VALUES (?, ?, ?, 1, ?, ?, ?) "
+    "ON CONFLICT(tool_name, date) DO UPDATE SET "
+    "call_count = call_count + 1, "
+    "success_count = success_count + excluded.success_count, "
+    "error_count = error_count + excluded.error_count, "
+    "avg_execution_time_ms = CASE WHEN excluded.avg_execution_time_ms > 0 "
+    "THEN (avg_execution_time_ms * call_count + excluded.avg_execution_time_ms) / (call_count + 1) "
+    "ELSE avg_execution_time_ms END"
+)
+
+_UPSERT_MEMORY_SQL = (
+    "INSERT INTO curated_memories (memory_id, timestamp_created, timestamp_updated, "
+    "source_conversation_id, memory_type, content, importance_level, tags, content_hash) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(content_hash) DO UPDATE SET content_hash = excluded.content_hash "
+    "RETURNING memory_id"
+)
+
+# OR IGNORE because the existence check and this insert are separate round
+# trips: two messages for a brand-new session stored concurrently both miss
+# the SELECT, and the loser of the insert race must be a no-op rather than
+# a UNIQUE violation
+_INSERT_SESSION_SQL = (
+    "INSERT OR IGNORE INTO sessions (session_id, start_timestamp, context) VALUES (?, ?, ?)"
+)
+
+_INSERT_CONVERSATION_SQL = (
+    "INSERT INTO conversations (conversation_id, session_id, start_timestamp) VALUES (?, ?, ?)"
+)
+
+_INSERT_REFLECTION_SQL = (
+    "INSERT INTO ai_reflections (reflection_id, timestamp, reflection_type, content, insights, "
+    "recommendations, confidence_level, source_period_days) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+_INSERT_USAGE_PATTERN_SQL = (
+    "INSERT INTO usage_patterns (pattern_id, timestamp, pattern_type, insight, "
+    "analysis_period_days, confidence_score, supporting_data) VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+_UPSERT_APPOINTMENT_SQL = (
+    "INSERT INTO appointments (appointment_id, timestamp_created, scheduled_datetime, title, "
+    "description, location, source_conversation_id, content_hash) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(content_hash) DO UPDATE SET content_hash = excluded.content_hash "
+    "RETURNING appointment_id"
+)
+
+_UPSERT_REMINDER_SQL = (
+    "INSERT INTO reminders (reminder_id, timestamp_created, due_datetime, content, "
+    "priority_level, source_conversation_id, content_hash) VALUES (?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(content_hash) DO UPDATE SET content_hash = excluded.content_hash "
+    "RETURNING reminder_id"
+)
+
+_INSERT_PROJECT_SESSION_SQL = (
+    "INSERT INTO project_sessions (session_id, start_timestamp, workspace_path, active_files, "
+    "git_branch, session_summary) VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+_INSERT_DEV_CONVERSATION_SQL = (
+    "INSERT INTO development_conversations (conversation_id, session_id, timestamp, "
+    "chat_context_id, conversation_content, decisions_made, code_changes) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+_SELECT_TOOL_CALLS_SQL = (
+    "SELECT * FROM tool_calls ORDER BY timestamp DESC LIMIT ?"
+)
+
+_SELECT_TOOL_CALLS_BY_NAME_SQL = (
+    "SELECT * FROM tool_calls WHERE tool_name = ? ORDER BY timestamp DESC LIMIT ?"
+)
+
+_SELECT_DUP_MESSAGE_SQL = (
+    "SELECT message_id FROM messages WHERE content_hash = ? AND conversation_id IN "
+    "(SELECT conversation_id FROM conversations WHERE session_id = ?) "
+    "AND timestamp > ?"
+)
+
+_SELECT_RECENT_MESSAGES_SQL = (
+    "SELECT m.*, c.session_id FROM messages m "
+    "JOIN conversations c ON m.conversation_id = c.conversation_id "
+    "ORDER BY m.timestamp DESC LIMIT ?"
+)
+
+_SELECT_RECENT_MESSAGES_BY_SESSION_SQL = (
+    "SELECT m.*, c.session_id FROM messages m "
+    "JOIN conversations c ON m.conversation_id = c.conversation_id "
+    "WHERE c.session_id = ? ORDER BY m.timestamp DESC LIMIT ?"
+)
+
+_UPSERT_PROJECT_INSIGHT_SQL = (
+    "INSERT INTO project_insights (insight_id, timestamp_created, timestamp_updated, "
+    "insight_type, content, related_files, source_conversation_id, importance_level, "
+    "content_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(content_hash) DO UPDATE SET content_hash = excluded.content_hash "
+    "RETURNING insight_id"
+)
+
+# Upper bound on per-database duplicate caches; 50k 16-byte keys is ~2MB
+# and covers hours of ingest at typical rates
+_DUP_CACHE_MAX = 50_000
+
+# Rows per transaction for bulk imports. Large enough that the per-commit
+# fsync is noise, small enough that the event loop gets a turn between
+# chunks; yielding per row instead would cost over an order of magnitude
+# in throughput
+_BULK_CHUNK_ROWS = 500
+
+# Registry of long-lived connections so they can be closed cleanly at exit
+_open_connections: List[sqlite3.Connection] = []
+_open_connections_lock = threading.Lock()
+
+def _close_open_connections():
+    """Close all cached connections at interpreter exit.
+
+    Runs PRAGMA optimize so the planner statistics survive the restart,
+    then checkpoints and truncates the WAL so no -wal/-shm files linger
+    for the next process (or a data-dir cleanup) to trip over.
+    """
+    with _open_connections_lock:
+        for conn in _open_connections:
+            try:
+                conn.execute("PRAGMA optimize")
+                # No-op on query_only readers; the writer connection does
+                # the actual truncation
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error:
+                pass
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        _open_connections.clear()
+
+atexit.register(_close_open_connections)
+
+def _row_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    """Cursor with name-based row access for read paths.
+
+    Row wrapping is applied per read cursor rather than connection-wide so
+    the write path is not charged Row-object construction it never uses.
+    """
+    cur = conn.cursor()
+    cur.row_factory = sqlite3.Row
+    return cur
+
+
 class DatabaseManager:
     """Base database manager for common operations"""
-    
+
+    # Database files whose WAL journal mode has already been set this process.
+    # WAL is persistent on the file, so the mode switch only needs to run on
+    # the first connection to each database.
+    _wal_initialized = set()
+    _wal_initialized_lock = threading.Lock()
+
+    # Process-wide connection pool: one executor (worker thread) and one set
+    # of thread-local connections per database file, shared by every manager
+    # instance that points at the same path. Without this, each instance
+    # opened its own connections - re-constructed systems (and managers
+    # sharing one file) threw away a hot page cache and multiplied writer
+    # lanes on the same database.
+    _pools = {}
+    _pools_lock = threading.Lock()
+
     def __init__(self, db_path: str):
         self.db_path = db_path
+        pool_key = str(Path(db_path).resolve())
+        with DatabaseManager._pools_lock:
+            pool = DatabaseManager._pools.get(pool_key)
+            if pool is None:
+                # One long-lived connection per thread - opening a fresh
+                # connection per statement throws away SQLite's page cache
+                # and pays file-open cost on each call. The single worker
+                # thread keeps blocking sqlite3 calls off the event loop and
+                # serializes writers, avoiding SQLITE_BUSY contention. WAL
+                # allows one writer plus many readers, so SELECTs get their
+                # own small thread pool of query_only connections instead of
+                # queueing behind INSERT commits.
+                pool = (threading.local(),
+                        ThreadPoolExecutor(max_workers=1),
+                        ThreadPoolExecutor(max_workers=4),
+                        OrderedDict())
+                DatabaseManager._pools[pool_key] = pool
+        # The fingerprint store is pooled alongside the connections: every
+        # manager instance on the same file shares one hash -> record-id map,
+        # so a duplicate written through one instance is caught in-process by
+        # all of them without a SQL round trip.
+        self._local, self._executor, self._read_executor, self._dup_cache = pool
+        # Write coalescing state; created lazily because the queue must be
+        # bound to the running event loop
+        self._batch_queue = None
+        self._batch_loop = None
+        self._batch_task = None
         self.ensure_database_exists()
-    
+
     def ensure_database_exists(self):
         """Ensure the database file and directory exist"""
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-        
+
     def get_connection(self) -> sqlite3.Connection:
-        """Get a database connection with proper configuration"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable dict-like access
-        conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
+        """Get the cached per-thread database connection, creating it on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                   cached_statements=_STATEMENT_CACHE_SIZE)
+            conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
+            self._configure_connection(conn)
+            self._local.conn = conn
+            with _open_connections_lock:
+                _open_connections.append(conn)
         return conn
-    
+
+    def _configure_connection(self, conn: sqlite3.Connection):
+        """Apply performance PRAGMAs to a freshly opened connection.
+
+        The defaults (rollback journal, synchronous=FULL) cost an fsync per
+        commit, which dominates runtime on the many-small-INSERTs workload of
+        tool calls, messages and memories. WAL batches writes into a log and
+        synchronous=NORMAL drops the per-commit fsync while staying
+        crash-safe in WAL mode.
+        """
+        with DatabaseManager._wal_initialized_lock:
+            if self.db_path not in DatabaseManager._wal_initialized:
+                # 8KB pages on brand-new files: fewer, larger allocations per
+                # B-tree level and fewer pager round trips for the TEXT/BLOB
+                # rows this system stores. Must happen before the first write
+                # and before WAL (page size is frozen once WAL starts), so
+                # existing databases keep whatever they were created with.
+                if conn.execute("PRAGMA page_count").fetchone()[0] == 0:
+                    conn.execute("PRAGMA page_size=8192")
+                conn.execute("PRAGMA journal_mode=WAL")
+                DatabaseManager._wal_initialized.add(self.db_path)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")  # 64MB page cache
+        conn.execute("PRAGMA mmap_size=268435456")  # 256MB memory-mapped I/O
+        conn.execute("PRAGMA busy_timeout=5000")
+
+    def _write_cursor(self) -> sqlite3.Cursor:
+        """Get the cached per-thread write cursor.
+
+        Connection.execute allocates a fresh Cursor per statement; reusing
+        one long-lived cursor keeps the hot insert path allocation-free and
+        lets the statement cache serve repeated SQL without re-preparation.
+        """
+        cur = getattr(self._local, "cursor", None)
+        if cur is None:
+            cur = self.get_connection().cursor()
+            self._local.cursor = cur
+        return cur
+
+    def _get_read_connection(self) -> sqlite3.Connection:
+        """Get the cached per-thread read-only connection.
+
+        Reader threads get their own query_only connections so SELECTs run
+        in parallel with the writer lane instead of queueing behind its
+        commits (WAL permits one writer plus any number of readers).
+        query_only also guarantees a stray write can never sneak onto a
+        reader connection and contend for the write lock.
+        """
+        conn = getattr(self._local, "read_conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                   cached_statements=_STATEMENT_CACHE_SIZE)
+            self._configure_connection(conn)
+            conn.execute("PRAGMA query_only=1")
+            self._local.read_conn = conn
+            with _open_connections_lock:
+                _open_connections.append(conn)
+        return conn
+
+    def _read_cursor(self) -> sqlite3.Cursor:
+        """Get the cached per-thread read cursor (Row-wrapped).
+
+        Mirrors `_write_cursor` for the query path: one long-lived cursor
+        per thread instead of a fresh allocation per SELECT. fetchall()
+        consumes the full result set, so reuse across calls is safe.
+        """
+        cur = getattr(self._local, "read_cursor", None)
+        if cur is None:
+            cur = _row_cursor(self._get_read_connection())
+            self._local.read_cursor = cur
+        return cur
+
+    def _sync_query(self, query: str, params: Tuple) -> List[sqlite3.Row]:
+        cursor = self._read_cursor()
+        cursor.execute(query, params)
+        return cursor.fetchall()
+
+    def _sync_update(self, query: str, params: Tuple) -> str:
+        conn = self.get_connection()
+        try:
+            cursor = self._write_cursor()
+            cursor.execute(query, params)
+            conn.commit()
+            return str(cursor.lastrowid)
+        except sqlite3.Error as e:
+            logger.error(f"Database error: {e}")
+            logger.error(f"Query: {query}")
+            logger.error(f"Params: {params}")
+            conn.rollback()
+            raise
+
+    def _sync_transaction(self, statements: List[Tuple[str, Tuple]]) -> None:
+        conn = self.get_connection()
+        try:
+            cursor = self._write_cursor()
+            for query, params in statements:
+                cursor.execute(query, params)
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Database error in transaction: {e}")
+            conn.rollback()
+            raise
+
     async def execute_query(self, query: str, params: Tuple = ()) -> List[sqlite3.Row]:
         """Execute a SELECT query and return results"""
-        with self.get_connection() as conn:
-            cursor = conn.execute(query, params)
-            return cursor.fetchall()
-    
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._read_executor, self._sync_query, query, params)
+
     async def execute_update(self, query: str, params: Tuple = ()) -> str:
         """Execute an INSERT/UPDATE/DELETE query and return last row ID"""
-        with self.get_connection() as conn:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._sync_update, query, params)
+
+    async def execute_returning(self, query: str, params: Tuple = ()) -> List[Tuple]:
+        """Execute a write carrying a RETURNING clause and fetch its rows"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._sync_returning, query, params)
+
+    def _sync_returning(self, query: str, params: Tuple) -> List[Tuple]:
+        conn = self.get_connection()
+        try:
+            cursor = self._write_cursor()
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            conn.commit()
+            return rows
+        except sqlite3.Error as e:
+            logger.error(f"Database error: {e}")
+            logger.error(f"Query: {query}")
+            conn.rollback()
+            raise
+
+    def _ensure_hash_column(self, conn: sqlite3.Connection, table: str,
+                            key_columns: Tuple[str, ...], unique: bool = True):
+        """Add and backfill the content_hash duplicate-detection column.
+
+        Duplicate checks used to be a pre-insert SELECT comparing unindexed
+        text columns - a full scan per write as tables grow. An index over
+        a 16-byte hash of the same key turns the check into a single B-tree
+        probe; with ``unique=True`` (the default) the check happens inside
+        the INSERT itself. Existing rows are backfilled so pre-upgrade data
+        still participates; for unique indexes, where old duplicates already
+        exist only the first of each group gets the hash so the index can
+        be built. ``unique=False`` is for tables whose dedup is scoped (for
+        example time-windowed), where repeats are legal and every row keeps
+        its hash.
+        """
+        existing_cols = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if "content_hash" not in existing_cols:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN content_hash BLOB")
+            seen = set()
+            updates = []
+            for row in conn.execute(f"SELECT rowid, {', '.join(key_columns)} FROM {table}"):
+                digest = _content_hash(*row[1:])
+                if unique:
+                    if digest in seen:
+                        continue
+                    seen.add(digest)
+                updates.append((digest, row[0]))
+            if updates:
+                conn.executemany(
+                    f"UPDATE {table} SET content_hash = ? WHERE rowid = ?", updates)
+        conn.execute(
+            f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS "
+            f"idx_{table}_content_hash ON {table}(content_hash)")
+
+    def _dup_cache_get(self, table: str, key: bytes) -> Optional[str]:
+        """Look up a dedup hash, honoring per-entry TTL and LRU order.
+
+        Entries are keyed by (table, hash): the cache is shared per database
+        file, and in single-database mode different record types with the
+        same key fields (e.g. a memory and an insight with identical
+        content and no type/source) would otherwise collide and hand back
+        an id from the wrong table.
+        """
+        entry = self._dup_cache.get((table, key))
+        if entry is None:
+            return None
+        record_id, expires = entry
+        if expires is not None and time.time() >= expires:
+            del self._dup_cache[(table, key)]
+            return None
+        self._dup_cache.move_to_end((table, key))
+        return record_id
+
+    def _dup_cache_put(self, table: str, key: bytes, record_id: str, ttl: float = None):
+        """Remember a dedup hash, evicting the least recently used overflow"""
+        self._dup_cache[(table, key)] = (record_id, time.time() + ttl if ttl else None)
+        self._dup_cache.move_to_end((table, key))
+        while len(self._dup_cache) > _DUP_CACHE_MAX:
+            self._dup_cache.popitem(last=False)
+
+    def _ensure_write_batcher(self):
+        """Start (or restart) the coalescing writer task on the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._batch_queue is None or self._batch_loop is not loop:
+            self._batch_queue = asyncio.Queue()
+            self._batch_loop = loop
+            self._batch_task = loop.create_task(self._write_batcher_loop())
+
+    async def execute_update_coalesced(self, query: str, params: Tuple = ()) -> None:
+        """Execute a write, coalescing concurrent writes into one commit.
+
+        Behaves like `execute_update` from the caller's point of view (the
+        coroutine returns once the row is committed), but every write queued
+        while a flush is in flight lands in the same transaction, so a burst
+        of N concurrent inserts pays one fsync instead of N. Use for inserts
+        whose IDs are generated in Python and that don't need lastrowid.
+        """
+        self._ensure_write_batcher()
+        fut = self._batch_loop.create_future()
+        self._batch_queue.put_nowait((query, params, fut))
+        return await fut
+
+    async def _write_batcher_loop(self):
+        """Drain queued writes and flush each batch as a single transaction"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._batch_queue.get()]
+            while not self._batch_queue.empty():
+                batch.append(self._batch_queue.get_nowait())
+            statements = [(query, params) for query, params, _ in batch]
             try:
-                cursor = conn.execute(query, params)
-                conn.commit()
-                return str(cursor.lastrowid)
-            except sqlite3.Error as e:
-                logger.error(f"Database error: {e}")
-                logger.error(f"Query: {query}")
-                logger.error(f"Params: {params}")
-                raise
+                await asyncio.shield(loop.run_in_executor(
+                    self._executor, self._sync_transaction, statements))
+            except Exception as e:
+                for _, _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+            else:
+                for _, _, fut in batch:
+                    if not fut.done():
+                        fut.set_result(None)
+
+    def _sync_many(self, query: str, rows: List[Tuple]) -> int:
+        conn = self.get_connection()
+        try:
+            cursor = self._write_cursor()
+            cursor.executemany(query, rows)
+            conn.commit()
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.error(f"Database error in bulk statement: {e}")
+            logger.error(f"Query: {query}")
+            conn.rollback()
+            raise
+
+    async def execute_transaction(self, statements: List[Tuple[str, Tuple]]) -> None:
+        """Execute several statements atomically in a single transaction"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._sync_transaction, statements)
+
+    async def execute_many(self, query: str, rows: List[Tuple]) -> int:
+        """Execute one statement for many parameter rows in a single transaction.
+
+        Batching N inserts into one commit pays one fsync per batch instead
+        of one per row, which is the dominant cost for bulk ingestion.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._sync_many, query, rows)
                 
     def parse_timestamp(self, timestamp: Union[str, int, float, None], fallback: Optional[datetime] = None) -> str:
         """Parse various timestamp formats into ISO format string.
@@ -174,7 +742,7 @@ class DatabaseManager:
             elif isinstance(timestamp, str):
                 # Try various string formats
                 try:
-                    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+                    dt = _parse_iso(timestamp.replace('Z', '+00:00'))
                 except ValueError:
                     # Try parsing with dateutil as fallback
                     from dateutil import parser
@@ -196,11 +764,19 @@ class MCPToolCallDatabase(DatabaseManager):
     
     def __init__(self, db_path: str = "mcp_tool_calls.db"):
         super().__init__(db_path)
+        # Write-behind queue for log entries; created lazily because it must
+        # be bound to the running event loop
+        self._log_queue = None
+        self._log_loop = None
+        self._log_writer_task = None
         self.initialize_tables()
-    
+
     def initialize_tables(self):
         """Create tool call tracking tables"""
         with self.get_connection() as conn:
+            # Run all DDL in one explicit transaction - each CREATE would
+            # otherwise auto-commit (and fsync) individually
+            conn.execute("BEGIN")
             # Tool calls table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS tool_calls (
@@ -211,7 +787,7 @@ class MCPToolCallDatabase(DatabaseManager):
                     parameters TEXT NOT NULL,
                     result TEXT,
                     status TEXT NOT NULL,
-                    execution_time_ms INTEGER,
+                    execution_time_ms REAL,
                     error_message TEXT,
                     created_at TEXT DEFAULT CURRENT_TIMESTAMP
                 )
@@ -220,7 +796,7 @@ class MCPToolCallDatabase(DatabaseManager):
             # Tool usage statistics
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS tool_usage_stats (
-                    stat_id TEXT PRIMARY KEY,
+                    stat_id TEXT,
                     tool_name TEXT NOT NULL,
                     date TEXT NOT NULL,
                     call_count INTEGER DEFAULT 0,
@@ -228,8 +804,8 @@ class MCPToolCallDatabase(DatabaseManager):
                     error_count INTEGER DEFAULT 0,
                     avg_execution_time_ms REAL DEFAULT 0,
                     created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(tool_name, date)
-                )
+                    PRIMARY KEY (tool_name, date)
+                ) WITHOUT ROWID
             """)
             
             # AI reflections table
@@ -260,104 +836,184 @@ class MCPToolCallDatabase(DatabaseManager):
                     created_at TEXT DEFAULT CURRENT_TIMESTAMP
                 )
             """)
-            
+
+            # Secondary indexes for the common filter columns - without these,
+            # tool-name/time-window lookups are full table scans on an
+            # append-heavy table
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_tool_calls_tool_ts ON tool_calls(tool_name, timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_tool_calls_ts ON tool_calls(timestamp DESC)")
+            # Covering index for the usage-summary GROUP BYs: the range scan
+            # over the time window finds tool_name and status in the index
+            # itself, so no table rows are touched
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_tool_calls_ts_name_status ON tool_calls(timestamp, tool_name, status)")
+
             conn.commit()
-    
+
     async def log_tool_call(self, tool_name: str, parameters: Dict, result: Any = None, 
                            status: str = "success", execution_time_ms: float = None,
                            error_message: str = None, client_id: str = None) -> str:
         """Log a tool call with all relevant details"""
         
-        call_id = str(uuid.uuid4())
+        call_id = _new_record_id()
         timestamp = get_current_timestamp()
-        
-        # Store the tool call
-        await self.execute_update(
-            """INSERT INTO tool_calls 
-               (call_id, timestamp, client_id, tool_name, parameters, result, 
-                status, execution_time_ms, error_message) 
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (call_id, timestamp, client_id, tool_name, 
-             json.dumps(parameters), json.dumps(result) if result else None,
-             status, int(execution_time_ms) if execution_time_ms else None, error_message)
-        )
-        
-        # Update daily statistics
-        await self._update_tool_stats(tool_name, status, execution_time_ms)
-        
+        today = _today_local()
+
+        # Serialize once up front; `result is not None` (rather than a
+        # truthiness check) keeps falsy-but-valid results like 0 or [] from
+        # being silently dropped.
+        params_json = _json_dumps(parameters)
+        result_json = _json_dumps(result) if result is not None else None
+
+        # Write-behind: the caller only needs the call_id, which is generated
+        # in Python, so the row (plus the UPSERT that maintains the daily
+        # stats) is queued for the background writer instead of making the
+        # caller wait on the commit fsync. Read paths drain the queue first,
+        # so history/summary queries still see every logged call.
+        self._ensure_log_writer()
+        self._log_queue.put_nowait((
+            (call_id, timestamp, client_id, tool_name,
+             params_json, result_json,
+             status, execution_time_ms, error_message),
+            (f"{tool_name}:{today}", tool_name, today,
+             1 if status == "success" else 0,
+             1 if status == "error" else 0,
+             execution_time_ms or 0),
+        ))
+
         return call_id
-    
-    async def _update_tool_stats(self, tool_name: str, status: str, execution_time_ms: float):
-        """Update daily usage statistics for a tool"""
-        today = datetime.now(get_local_timezone()).date().isoformat()
-        
-        # Check if stat record exists for today
-        existing = await self.execute_query(
-            "SELECT * FROM tool_usage_stats WHERE tool_name = ? AND date = ?",
-            (tool_name, today)
-        )
-        
-        if existing:
-            # Update existing record
-            stat = existing[0]
-            new_call_count = stat["call_count"] + 1
-            new_success_count = stat["success_count"] + (1 if status == "success" else 0)
-            new_error_count = stat["error_count"] + (1 if status == "error" else 0)
-            
-            # Calculate new average execution time
-            if execution_time_ms and stat["avg_execution_time_ms"]:
-                new_avg = ((stat["avg_execution_time_ms"] * stat["call_count"]) + execution_time_ms) / new_call_count
-            elif execution_time_ms:
-                new_avg = execution_time_ms
-            else:
-                new_avg = stat["avg_execution_time_ms"]
-            
-            await self.execute_update(
-                """UPDATE tool_usage_stats 
-                   SET call_count = ?, success_count = ?, error_count = ?, avg_execution_time_ms = ?
-                   WHERE tool_name = ? AND date = ?""",
-                (new_call_count, new_success_count, new_error_count, new_avg, tool_name, today)
+
+    def _ensure_log_writer(self):
+        """Start (or restart) the background log writer on the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._log_queue is None or self._log_loop is not loop:
+            # First call on this event loop, or a fresh loop after asyncio.run
+            self._log_queue = asyncio.Queue()
+            self._log_loop = loop
+            self._log_writer_task = loop.create_task(self._log_writer_loop())
+
+    async def _log_writer_loop(self):
+        """Drain queued tool-call rows and flush each batch in one transaction.
+
+        Blocks on the first pending entry, then opportunistically grabs
+        everything else already queued so a burst of log calls costs a single
+        commit instead of one fsync per call.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._log_queue.get()]
+            while not self._log_queue.empty():
+                batch.append(self._log_queue.get_nowait())
+            try:
+                await asyncio.shield(loop.run_in_executor(
+                    self._executor, self._flush_log_batch, batch))
+            except Exception as e:
+                logger.error(f"Error flushing tool call log batch: {e}")
+            finally:
+                for _ in batch:
+                    self._log_queue.task_done()
+
+    def _flush_log_batch(self, batch):
+        """Write a batch of (tool_call_row, stats_row) pairs in one commit"""
+        conn = self.get_connection()
+        cursor = self._write_cursor()
+        try:
+            cursor.executemany(_INSERT_TOOL_CALL_SQL, [rows[0] for rows in batch])
+            cursor.executemany(_UPSERT_TOOL_STATS_SQL, [rows[1] for rows in batch])
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Database error flushing tool call batch: {e}")
+            conn.rollback()
+            raise
+
+    async def flush_pending_logs(self):
+        """Wait until every queued tool-call row has been committed"""
+        if self._log_queue is not None and self._log_loop is asyncio.get_running_loop():
+            await self._log_queue.join()
+
+    async def log_tool_calls_bulk(self, calls: List[Dict]) -> List[str]:
+        """Log many tool calls in one transaction with executemany.
+
+        Args:
+            calls: List of dicts with the same keys as `log_tool_call` accepts
+
+        Returns:
+            List of call IDs in input order
+        """
+        call_ids = []
+        insert_rows = []
+        stat_rows = []
+        today = _today_local()
+
+        for call in calls:
+            call_id = _new_record_id()
+            call_ids.append(call_id)
+            status = call.get("status", "success")
+            execution_time_ms = call.get("execution_time_ms")
+            result = call.get("result")
+            insert_rows.append(
+                (call_id, get_current_timestamp(), call.get("client_id"), call["tool_name"],
+                 _json_dumps(call.get("parameters", {})),
+                 _json_dumps(result) if result is not None else None,
+                 status, execution_time_ms,
+                 call.get("error_message"))
             )
-        else:
-            # Create new record
-            stat_id = str(uuid.uuid4())
-            await self.execute_update(
-                """INSERT INTO tool_usage_stats 
-                   (stat_id, tool_name, date, call_count, success_count, error_count, avg_execution_time_ms)
-                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                (stat_id, tool_name, today, 1,
+            stat_rows.append(
+                (f"{call['tool_name']}:{today}", call["tool_name"], today,
                  1 if status == "success" else 0,
                  1 if status == "error" else 0,
                  execution_time_ms or 0)
             )
-    
+
+        await self.execute_many(_INSERT_TOOL_CALL_SQL, insert_rows)
+        await self.execute_many(_UPSERT_TOOL_STATS_SQL, stat_rows)
+        return call_ids
+
     async def get_tool_usage_summary(self, days: int = 7) -> Dict:
         """Get tool usage summary for the last N days"""
-        
+
+        # Make sure queued log entries are visible before aggregating
+        await self.flush_pending_logs()
+
+        # Cutoffs are computed in Python and bound as parameters: the
+        # queries stay byte-identical across calls (statement-cache hits)
+        # and the literal range bound lets SQLite drive the covering
+        # (timestamp, tool_name, status) index. The local-timezone ISO
+        # cutoff also matches the format rows are stored in, which the old
+        # UTC datetime('now') comparison did not.
+        now_local = datetime.now(get_local_timezone())
+        ts_cutoff = (now_local - timedelta(days=days)).isoformat()
+        date_cutoff = (now_local - timedelta(days=days)).date().isoformat()
+
         # Get recent tool calls
         recent_calls = await self.execute_query(
             """SELECT tool_name, status, COUNT(*) as count
                FROM tool_calls 
-               WHERE timestamp >= datetime('now', '-{} days')
+               WHERE timestamp >= ?
                GROUP BY tool_name, status
-               ORDER BY count DESC""".format(days)
+               ORDER BY count DESC""",
+            (ts_cutoff,)
         )
         
         # Get daily stats
         daily_stats = await self.execute_query(
             """SELECT * FROM tool_usage_stats 
-               WHERE date >= date('now', '-{} days')
-               ORDER BY date DESC, call_count DESC""".format(days)
+               WHERE date >= ?
+               ORDER BY date DESC, call_count DESC""",
+            (date_cutoff,)
         )
         
-        # Get most used tools
+        # Get most used tools from the daily rollup - tool_usage_stats is
+        # maintained transactionally with every logged call, so summing a
+        # handful of per-day rows replaces a scan over the raw tool_calls
+        # window entirely
         most_used = await self.execute_query(
-            """SELECT tool_name, COUNT(*) as total_calls
-               FROM tool_calls 
-               WHERE timestamp >= datetime('now', '-{} days')
+            """SELECT tool_name, SUM(call_count) as total_calls
+               FROM tool_usage_stats 
+               WHERE date >= ?
                GROUP BY tool_name
                ORDER BY total_calls DESC
-               LIMIT 10""".format(days)
+               LIMIT 10""",
+            (date_cutoff,)
         )
         
         return {
@@ -367,22 +1023,35 @@ class MCPToolCallDatabase(DatabaseManager):
             "period_days": days
         }
     
-    async def get_tool_call_history(self, tool_name: str = None, limit: int = 50) -> List[Dict]:
-        """Get recent tool call history, optionally filtered by tool name"""
-        
+    async def get_tool_call_history(self, tool_name: str = None, limit: int = 50,
+                                    columnar: bool = False) -> Union[List[Dict], Dict]:
+        """Get recent tool call history, optionally filtered by tool name.
+
+        With ``columnar=True`` the result is a single dict of column arrays
+        ({"columns": [...], "rows_by_col": {col: [values...]}}) instead of a
+        list of per-row dicts. For large histories that skips one dict (and
+        its repeated key strings) per row and serializes smaller.
+        """
+
+        # Make sure queued log entries are visible before reading history
+        await self.flush_pending_logs()
+
         if tool_name:
-            query = """SELECT * FROM tool_calls 
-                      WHERE tool_name = ? 
-                      ORDER BY timestamp DESC 
-                      LIMIT ?"""
+            query = _SELECT_TOOL_CALLS_BY_NAME_SQL
             params = (tool_name, limit)
         else:
-            query = """SELECT * FROM tool_calls 
-                      ORDER BY timestamp DESC 
-                      LIMIT ?"""
+            query = _SELECT_TOOL_CALLS_SQL
             params = (limit,)
-        
+
         rows = await self.execute_query(query, params)
+        if columnar:
+            columns = list(rows[0].keys()) if rows else []
+            return {
+                "columns": columns,
+                "rows_by_col": {
+                    col: [row[i] for row in rows] for i, col in enumerate(columns)
+                },
+            }
         return [dict(row) for row in rows]
         
     async def store_ai_reflection(self, reflection_type: str, content: str,
@@ -401,17 +1070,14 @@ class MCPToolCallDatabase(DatabaseManager):
         Returns:
             str: Reflection ID
         """
-        reflection_id = str(uuid.uuid4())
+        reflection_id = _new_record_id()
         timestamp = get_current_timestamp()
         
         await self.execute_update(
-            """INSERT INTO ai_reflections 
-               (reflection_id, timestamp, reflection_type, content, insights, 
-                recommendations, confidence_level, source_period_days)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            _INSERT_REFLECTION_SQL,
             (reflection_id, timestamp, reflection_type, content,
-             json.dumps(insights) if insights else None,
-             json.dumps(recommendations) if recommendations else None,
+             _json_dumps(insights) if insights is not None else None,
+             _json_dumps(recommendations) if recommendations is not None else None,
              confidence_level, source_period_days)
         )
         
@@ -432,16 +1098,13 @@ class MCPToolCallDatabase(DatabaseManager):
         Returns:
             str: Pattern ID
         """
-        pattern_id = str(uuid.uuid4())
+        pattern_id = _new_record_id()
         timestamp = get_current_timestamp()
         
         await self.execute_update(
-            """INSERT INTO usage_patterns
-               (pattern_id, timestamp, pattern_type, insight, analysis_period_days,
-                confidence_score, supporting_data)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            _INSERT_USAGE_PATTERN_SQL,
             (pattern_id, timestamp, pattern_type, insight, analysis_period_days,
-             confidence_score, json.dumps(supporting_data) if supporting_data else None)
+             confidence_score, _json_dumps(supporting_data) if supporting_data is not None else None)
         )
         
         return pattern_id
@@ -482,6 +1145,9 @@ class ConversationDatabase(DatabaseManager):
     def initialize_tables(self):
         """Create tables if they don't exist, and migrate schema if columns are missing"""
         with self.get_connection() as conn:
+            # Run all DDL in one explicit transaction - each CREATE would
+            # otherwise auto-commit (and fsync) individually
+            conn.execute("BEGIN")
             # --- Migration logic for messages table ---
             expected_columns = [
                 'message_id', 'conversation_id', 'timestamp', 'role', 'content', 'source_type',
@@ -498,7 +1164,7 @@ class ConversationDatabase(DatabaseManager):
                         break
             if needs_migration:
                 print("Migrating messages table to new schema!")
-                old_rows = conn.execute("SELECT * FROM messages").fetchall()
+                old_rows = _row_cursor(conn).execute("SELECT * FROM messages").fetchall()
                 conn.execute("DROP TABLE IF EXISTS messages")
                 conn.execute("""
                     CREATE TABLE messages (
@@ -519,15 +1185,14 @@ class ConversationDatabase(DatabaseManager):
                         FOREIGN KEY (conversation_id) REFERENCES conversations (conversation_id)
                     )
                 """)
+                restored_rows = []
                 for row in old_rows:
                     row_dict = dict(row)
-                    for col in expected_columns:
-                        if col not in row_dict:
-                            row_dict[col] = None
-                    conn.execute(
-                        f"INSERT INTO messages ({', '.join(expected_columns)}) VALUES ({', '.join(['?' for _ in expected_columns])})",
-                        tuple(row_dict[col] for col in expected_columns)
-                    )
+                    restored_rows.append(tuple(row_dict.get(col) for col in expected_columns))
+                conn.executemany(
+                    f"INSERT INTO messages ({', '.join(expected_columns)}) VALUES ({', '.join(['?' for _ in expected_columns])})",
+                    restored_rows
+                )
                 print(f"Restored {len(old_rows)} messages after migration.")
             else:
                 # Create table if not exists (normal path)
@@ -606,26 +1271,59 @@ class ConversationDatabase(DatabaseManager):
                 )
             """)
 
+            # Indexes matching the hot predicates: conversation/time-window
+            # retrieval, global recency ordering, and the session subquery
+            # used by duplicate detection
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_conv_ts ON messages(conversation_id, timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_ts ON messages(timestamp DESC)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_conversations_session ON conversations(session_id)")
+
+            # The dedup probe matches on a 16-byte hash of (role, content)
+            # instead of a (content, role) index whose keys duplicated every
+            # message body on disk. Non-unique because message dedup is
+            # scoped to a one-hour window per session - exact repeats
+            # outside it are legitimate rows.
+            conn.execute("DROP INDEX IF EXISTS idx_messages_content_role")
+            self._ensure_hash_column(conn, "messages", ("role", "content"), unique=False)
+
             conn.commit()
     
     async def store_message(self, content: str, role: str, session_id: str = None, 
                           conversation_id: str = None, metadata: Dict = None) -> Dict[str, str]:
         """Store a message and auto-manage sessions/conversations with duplicate detection"""
         timestamp = get_current_timestamp()
-        message_id = str(uuid.uuid4())
+        message_id = _new_record_id()
 
-        # Advanced duplicate detection: check for existing message with same content, role, and session in last hour
+        # Advanced duplicate detection: check for existing message with same content, role, and session in last hour.
+        # The in-process LRU (TTL matching the one-hour SQL window) catches
+        # rapid repeats without any SELECT.
+        # Stored with every row so the dedup probe is a hash-index lookup
+        # rather than a comparison over full message bodies
+        row_digest = _content_hash(role, content)
+        digest = None
         if session_id:
+            digest = _content_hash(session_id, role, content)
+            cached_id = self._dup_cache_get("messages", digest)
+            if cached_id is not None:
+                print(f"Skipping duplicate message in session {session_id}")
+                return {
+                    "message_id": cached_id,
+                    "conversation_id": None,
+                    "session_id": session_id,
+                    "duplicate": True
+                }
+            # The window cutoff is computed in Python and bound as a plain
+            # parameter: no per-row datetime() calls, the statement text is
+            # constant, and the comparison uses the same local-ISO format
+            # the rows are stored in
+            hour_ago = (datetime.now(get_local_timezone()) - timedelta(hours=1)).isoformat()
             existing = await self.execute_query(
-                """SELECT message_id FROM messages 
-                   WHERE conversation_id IN (
-                       SELECT conversation_id FROM conversations WHERE session_id = ?
-                   ) AND role = ? AND content = ? 
-                   AND datetime(timestamp) > datetime('now', '-1 hour')""",
-                (session_id, role, content)
+                _SELECT_DUP_MESSAGE_SQL,
+                (row_digest, session_id, hour_ago)
             )
             if existing:
                 print(f"Skipping duplicate message in session {session_id}")
+                self._dup_cache_put("messages", digest, existing[0]["message_id"], ttl=3600)
                 return {
                     "message_id": existing[0]["message_id"],
                     "conversation_id": None,
@@ -635,9 +1333,9 @@ class ConversationDatabase(DatabaseManager):
 
         # Auto-create session if not provided or doesn't exist
         if not session_id:
-            session_id = str(uuid.uuid4())
+            session_id = _new_record_id()
             await self.execute_update(
-                "INSERT INTO sessions (session_id, start_timestamp, context) VALUES (?, ?, ?)",
+                _INSERT_SESSION_SQL,
                 (session_id, timestamp, "auto-created")
             )
         else:
@@ -647,26 +1345,28 @@ class ConversationDatabase(DatabaseManager):
             )
             if not existing_session:
                 await self.execute_update(
-                    "INSERT INTO sessions (session_id, start_timestamp, context) VALUES (?, ?, ?)",
+                    _INSERT_SESSION_SQL,
                     (session_id, timestamp, "imported-session")
                 )
 
         # Auto-create conversation if not provided
         if not conversation_id:
-            conversation_id = str(uuid.uuid4())
+            conversation_id = _new_record_id()
             await self.execute_update(
-                "INSERT INTO conversations (conversation_id, session_id, start_timestamp) VALUES (?, ?, ?)",
+                _INSERT_CONVERSATION_SQL,
                 (conversation_id, session_id, timestamp)
             )
 
-        # Store the message
-        await self.execute_update(
-            """INSERT INTO messages 
-               (message_id, conversation_id, timestamp, role, content, metadata) 
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (message_id, conversation_id, timestamp, role, content, 
-             json.dumps(metadata) if metadata else None)
+        # Store the message; `is not None` so an empty metadata dict is
+        # preserved rather than coerced to NULL
+        await self.execute_update_coalesced(
+            _INSERT_MESSAGE_SQL,
+            (message_id, conversation_id, timestamp, role, content,
+             _json_dumps(metadata) if metadata is not None else None,
+             row_digest)
         )
+        if digest is not None:
+            self._dup_cache_put("messages", digest, message_id, ttl=3600)
 
         return {
             "message_id": message_id,
@@ -674,28 +1374,67 @@ class ConversationDatabase(DatabaseManager):
             "session_id": session_id,
             "duplicate": False
         }
-    
+
+    async def store_messages_bulk(self, messages: List[Dict]) -> List[str]:
+        """Store many messages for existing conversations in one transaction.
+
+        Unlike `store_message` this skips session auto-creation and the
+        hourly-window duplicate SELECT, so each dict must carry a valid
+        `conversation_id`. Exact repeats *within* the batch are collapsed in
+        Python via the same BLAKE2b key before any SQL runs - import files
+        commonly repeat messages - and each duplicate maps to the id of its
+        first occurrence. Intended for bulk import paths where one commit
+        per message is too expensive.
+
+        Args:
+            messages: List of dicts with conversation_id, role, content and
+                optional timestamp/metadata keys
+
+        Returns:
+            List of message IDs in input order (duplicates share an ID)
+        """
+        message_ids = []
+        rows = []
+        seen_in_batch = {}
+        for msg in messages:
+            digest = _content_hash(msg["conversation_id"], msg["role"], msg["content"])
+            first_id = seen_in_batch.get(digest)
+            if first_id is not None:
+                message_ids.append(first_id)
+                continue
+            message_id = _new_record_id()
+            seen_in_batch[digest] = message_id
+            message_ids.append(message_id)
+            rows.append(
+                (message_id, msg["conversation_id"],
+                 msg.get("timestamp") or get_current_timestamp(),
+                 msg["role"], msg["content"],
+                 _json_dumps(msg["metadata"]) if msg.get("metadata") is not None else None,
+                 _content_hash(msg["role"], msg["content"]))
+            )
+
+        # Large imports are flushed in chunks with an event-loop yield in
+        # between, so a 10k-row file does not freeze every other coroutine
+        # for the whole write. Each chunk is its own transaction: one fsync
+        # per _BULK_CHUNK_ROWS rows still amortizes the commit cost, and a
+        # single import-wide transaction would be unsafe here anyway - the
+        # writer lane is shared, so a concurrent store's commit during the
+        # yield would flush it partially.
+        for start in range(0, len(rows), _BULK_CHUNK_ROWS):
+            await self.execute_many(_INSERT_MESSAGE_SQL, rows[start:start + _BULK_CHUNK_ROWS])
+            if start + _BULK_CHUNK_ROWS < len(rows):
+                await asyncio.sleep(0)
+        return message_ids
+
+
     async def get_recent_messages(self, limit: int = 10, session_id: str = None) -> List[Dict]:
         """Get recent messages, optionally filtered by session"""
         
         if session_id:
-            query = """
-                SELECT m.*, c.session_id 
-                FROM messages m 
-                JOIN conversations c ON m.conversation_id = c.conversation_id
-                WHERE c.session_id = ?
-                ORDER BY m.timestamp DESC 
-                LIMIT ?
-            """
+            query = _SELECT_RECENT_MESSAGES_BY_SESSION_SQL
             params = (session_id, limit)
         else:
-            query = """
-                SELECT m.*, c.session_id 
-                FROM messages m 
-                JOIN conversations c ON m.conversation_id = c.conversation_id
-                ORDER BY m.timestamp DESC 
-                LIMIT ?
-            """
+            query = _SELECT_RECENT_MESSAGES_SQL
             params = (limit,)
         
         rows = await self.execute_query(query, params)
@@ -712,6 +1451,9 @@ class AIMemoryDatabase(DatabaseManager):
     def initialize_tables(self):
         """Create tables if they don't exist, and migrate schema if columns are missing"""
         with self.get_connection() as conn:
+            # Run all DDL in one explicit transaction - each CREATE would
+            # otherwise auto-commit (and fsync) individually
+            conn.execute("BEGIN")
             expected_columns = [
                 'memory_id', 'timestamp_created', 'timestamp_updated', 'source_conversation_id',
                 'source_message_ids', 'memory_type', 'content', 'importance_level', 'tags',
@@ -727,7 +1469,7 @@ class AIMemoryDatabase(DatabaseManager):
                         break
             if needs_migration:
                 print("Migrating curated_memories table to new schema!")
-                old_rows = conn.execute("SELECT * FROM curated_memories").fetchall()
+                old_rows = _row_cursor(conn).execute("SELECT * FROM curated_memories").fetchall()
                 conn.execute("DROP TABLE IF EXISTS curated_memories")
                 conn.execute("""
                     CREATE TABLE curated_memories (
@@ -744,15 +1486,14 @@ class AIMemoryDatabase(DatabaseManager):
                         created_at TEXT DEFAULT CURRENT_TIMESTAMP
                     )
                 """)
+                restored_rows = []
                 for row in old_rows:
                     row_dict = dict(row)
-                    for col in expected_columns:
-                        if col not in row_dict:
-                            row_dict[col] = None
-                    conn.execute(
-                        f"INSERT INTO curated_memories ({', '.join(expected_columns)}) VALUES ({', '.join(['?' for _ in expected_columns])})",
-                        tuple(row_dict[col] for col in expected_columns)
-                    )
+                    restored_rows.append(tuple(row_dict.get(col) for col in expected_columns))
+                conn.executemany(
+                    f"INSERT INTO curated_memories ({', '.join(expected_columns)}) VALUES ({', '.join(['?' for _ in expected_columns])})",
+                    restored_rows
+                )
                 print(f"Restored {len(old_rows)} curated memories after migration.")
             else:
                 conn.execute("""
@@ -770,35 +1511,41 @@ class AIMemoryDatabase(DatabaseManager):
                         created_at TEXT DEFAULT CURRENT_TIMESTAMP
                     )
                 """)
+
+            # Index for type/importance-filtered memory searches
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_memories_type_imp ON curated_memories(memory_type, importance_level)")
+
             conn.commit()
 
-    async def create_memory(self, content: str, memory_type: str = None, 
+    async def create_memory(self, content: str, memory_type: str = None,
                           importance_level: int = 5, tags: List[str] = None,
                           source_conversation_id: str = None) -> str:
         """Create a new curated memory with duplicate detection"""
-        memory_id = str(uuid.uuid4())
+        memory_id = _new_record_id()
         timestamp = get_current_timestamp()
 
         # Advanced duplicate detection: check for existing memory with same content, type, and source
-        existing = await self.execute_query(
-            """SELECT memory_id FROM curated_memories 
-                   WHERE content = ? AND memory_type = ? AND source_conversation_id IS ?""",
-            (content, memory_type, source_conversation_id)
-        )
-        if existing:
+        # Check-and-insert in one round trip: the UNIQUE content_hash index
+        # resolves duplicates inside the INSERT, and RETURNING hands back
+        # whichever memory_id won (the old pre-SELECT was a full scan). The
+        # in-process LRU short-circuits repeats before any SQL happens.
+        digest = _content_hash(content, memory_type, source_conversation_id)
+        cached_id = self._dup_cache_get("curated_memories", digest)
+        if cached_id is not None:
             print("Skipping duplicate curated memory entry.")
-            return existing[0]["memory_id"]
-
-        await self.execute_update(
-            """INSERT INTO curated_memories 
-               (memory_id, timestamp_created, timestamp_updated, source_conversation_id, 
-                memory_type, content, importance_level, tags) 
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            return cached_id
+        rows = await self.execute_returning(
+            _UPSERT_MEMORY_SQL,
             (memory_id, timestamp, timestamp, source_conversation_id, 
              memory_type, content, importance_level, 
-             json.dumps(tags) if tags else None)
+             _json_dumps(tags) if tags is not None else None,
+             digest)
         )
-        return memory_id
+        stored_id = rows[0][0]
+        if stored_id != memory_id:
+            print("Skipping duplicate curated memory entry.")
+        self._dup_cache_put("curated_memories", digest, stored_id)
+        return stored_id
         """Run database maintenance tasks.
         
         Args:
@@ -859,6 +1606,9 @@ class AIMemoryDatabase(DatabaseManager):
     def initialize_tables(self):
         """Create tables if they don't exist"""
         with self.get_connection() as conn:
+            # Run all DDL in one explicit transaction - each CREATE would
+            # otherwise auto-commit (and fsync) individually
+            conn.execute("BEGIN")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS curated_memories (
                     memory_id TEXT PRIMARY KEY,
@@ -874,6 +1624,12 @@ class AIMemoryDatabase(DatabaseManager):
                     created_at TEXT DEFAULT CURRENT_TIMESTAMP
                 )
             """)
+
+            # Hash-backed duplicate detection (single B-tree probe per insert)
+            self._ensure_hash_column(
+                conn, "curated_memories",
+                ("content", "memory_type", "source_conversation_id"))
+
             conn.commit()
     
     async def create_memory(self, content: str, memory_type: str = None, 
@@ -881,20 +1637,29 @@ class AIMemoryDatabase(DatabaseManager):
                           source_conversation_id: str = None) -> str:
         """Create a new curated memory"""
         
-        memory_id = str(uuid.uuid4())
+        memory_id = _new_record_id()
         timestamp = get_current_timestamp()
         
-        await self.execute_update(
-            """INSERT INTO curated_memories 
-               (memory_id, timestamp_created, timestamp_updated, source_conversation_id, 
-                memory_type, content, importance_level, tags) 
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+        # Duplicate detection rides on the UNIQUE content_hash index: the
+        # INSERT either lands the new row or returns the existing memory_id.
+        # The in-process LRU short-circuits repeats before any SQL happens.
+        digest = _content_hash(content, memory_type, source_conversation_id)
+        cached_id = self._dup_cache_get("curated_memories", digest)
+        if cached_id is not None:
+            print("Skipping duplicate curated memory entry.")
+            return cached_id
+        rows = await self.execute_returning(
+            _UPSERT_MEMORY_SQL,
             (memory_id, timestamp, timestamp, source_conversation_id, 
              memory_type, content, importance_level, 
-             json.dumps(tags) if tags else None)
+             _json_dumps(tags) if tags is not None else None,
+             digest)
         )
-        
-        return memory_id
+        stored_id = rows[0][0]
+        if stored_id != memory_id:
+            print("Skipping duplicate curated memory entry.")
+        self._dup_cache_put("curated_memories", digest, stored_id)
+        return stored_id
 
 
 class ScheduleDatabase(DatabaseManager):
@@ -907,6 +1672,9 @@ class ScheduleDatabase(DatabaseManager):
     def initialize_tables(self):
         """Create tables if they don't exist, and migrate schema if columns are missing"""
         with self.get_connection() as conn:
+            # Run all DDL in one explicit transaction - each CREATE would
+            # otherwise auto-commit (and fsync) individually
+            conn.execute("BEGIN")
             # Appointments table migration
             appointments_expected = [
                 'appointment_id', 'timestamp_created', 'scheduled_datetime', 'title', 'description',
@@ -922,7 +1690,7 @@ class ScheduleDatabase(DatabaseManager):
                         break
             if needs_migration:
                 print("Migrating appointments table to new schema!")
-                old_rows = conn.execute("SELECT * FROM appointments").fetchall()
+                old_rows = _row_cursor(conn).execute("SELECT * FROM appointments").fetchall()
                 conn.execute("DROP TABLE IF EXISTS appointments")
                 conn.execute("""
                     CREATE TABLE appointments (
@@ -937,15 +1705,14 @@ class ScheduleDatabase(DatabaseManager):
                         created_at TEXT DEFAULT CURRENT_TIMESTAMP
                     )
                 """)
+                restored_rows = []
                 for row in old_rows:
                     row_dict = dict(row)
-                    for col in appointments_expected:
-                        if col not in row_dict:
-                            row_dict[col] = None
-                    conn.execute(
-                        f"INSERT INTO appointments ({', '.join(appointments_expected)}) VALUES ({', '.join(['?' for _ in appointments_expected])})",
-                        tuple(row_dict[col] for col in appointments_expected)
-                    )
+                    restored_rows.append(tuple(row_dict.get(col) for col in appointments_expected))
+                conn.executemany(
+                    f"INSERT INTO appointments ({', '.join(appointments_expected)}) VALUES ({', '.join(['?' for _ in appointments_expected])})",
+                    restored_rows
+                )
                 print(f"Restored {len(old_rows)} appointments after migration.")
             # Appointments table migration
             appointments_expected = [
@@ -962,7 +1729,7 @@ class ScheduleDatabase(DatabaseManager):
                         break
             if needs_migration:
                 print("Migrating appointments table to new schema!")
-                old_rows = conn.execute("SELECT * FROM appointments").fetchall()
+                old_rows = _row_cursor(conn).execute("SELECT * FROM appointments").fetchall()
                 conn.execute("DROP TABLE IF EXISTS appointments")
                 conn.execute("""
                     CREATE TABLE appointments (
@@ -978,18 +1745,16 @@ class ScheduleDatabase(DatabaseManager):
                         created_at TEXT DEFAULT CURRENT_TIMESTAMP
                     )
                 """)
+                restored_rows = []
                 for row in old_rows:
                     row_dict = dict(row)
-                    for col in appointments_expected:
-                        if col not in row_dict:
-                            if col == 'is_cancelled':
-                                row_dict[col] = 0
-                            else:
-                                row_dict[col] = None
-                    conn.execute(
-                        f"INSERT INTO appointments ({', '.join(appointments_expected)}) VALUES ({', '.join(['?' for _ in appointments_expected])})",
-                        [row_dict[col] for col in appointments_expected]
-                    )
+                    if 'is_cancelled' not in row_dict:
+                        row_dict['is_cancelled'] = 0
+                    restored_rows.append(tuple(row_dict.get(col) for col in appointments_expected))
+                conn.executemany(
+                    f"INSERT INTO appointments ({', '.join(appointments_expected)}) VALUES ({', '.join(['?' for _ in appointments_expected])})",
+                    restored_rows
+                )
             else:
                 conn.execute("""
                     CREATE TABLE IF NOT EXISTS appointments (
@@ -1021,7 +1786,7 @@ class ScheduleDatabase(DatabaseManager):
                         break
             if needs_migration:
                 print("Migrating reminders table to new schema!")
-                old_rows = conn.execute("SELECT * FROM reminders").fetchall()
+                old_rows = _row_cursor(conn).execute("SELECT * FROM reminders").fetchall()
                 conn.execute("DROP TABLE IF EXISTS reminders")
                 conn.execute("""
                     CREATE TABLE reminders (
@@ -1038,18 +1803,16 @@ class ScheduleDatabase(DatabaseManager):
                         created_at TEXT DEFAULT CURRENT_TIMESTAMP
                     )
                 """)
+                restored_rows = []
                 for row in old_rows:
                     row_dict = dict(row)
-                    for col in reminders_expected:
-                        if col not in row_dict:
-                            if col == 'is_completed':
-                                row_dict[col] = row_dict.get('completed', 0)
-                            else:
-                                row_dict[col] = None
-                    conn.execute(
-                        f"INSERT INTO reminders ({', '.join(reminders_expected)}) VALUES ({', '.join(['?' for _ in reminders_expected])})",
-                        tuple(row_dict[col] for col in reminders_expected)
-                    )
+                    if 'is_completed' not in row_dict:
+                        row_dict['is_completed'] = row_dict.get('completed', 0)
+                    restored_rows.append(tuple(row_dict.get(col) for col in reminders_expected))
+                conn.executemany(
+                    f"INSERT INTO reminders ({', '.join(reminders_expected)}) VALUES ({', '.join(['?' for _ in reminders_expected])})",
+                    restored_rows
+                )
                 print(f"Restored {len(old_rows)} reminders after migration.")
             else:
                 conn.execute("""
@@ -1065,56 +1828,74 @@ class ScheduleDatabase(DatabaseManager):
                         created_at TEXT DEFAULT CURRENT_TIMESTAMP
                     )
                 """)
+
+            # Indexes for date-window schedule queries. The active-reminder
+            # lookups filter on completion flags, so partial indexes keep
+            # only the open reminders - the set those queries actually walk.
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_appointments_when ON appointments(scheduled_datetime)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_reminders_due ON reminders(due_datetime)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_reminders_active ON reminders(due_datetime) WHERE completed = 0")
+            reminder_cols = {row[1] for row in conn.execute("PRAGMA table_info(reminders)")}
+            if "is_completed" in reminder_cols:
+                # Only present on databases migrated through the newer schema
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_reminders_open ON reminders(due_datetime) WHERE is_completed = 0")
+
+            # Hash-backed duplicate detection (single B-tree probe per insert)
+            self._ensure_hash_column(
+                conn, "appointments",
+                ("title", "scheduled_datetime", "location", "source_conversation_id"))
+            self._ensure_hash_column(
+                conn, "reminders",
+                ("content", "due_datetime", "source_conversation_id"))
+
             conn.commit()
-    
+
     async def create_appointment(self, title: str, scheduled_datetime: str, 
                                description: str = None, location: str = None,
                                source_conversation_id: str = None) -> str:
         """Create a new appointment with duplicate detection"""
-        appointment_id = str(uuid.uuid4())
+        appointment_id = _new_record_id()
         timestamp = get_current_timestamp()
 
         # Duplicate detection: check for existing appointment with same title, datetime, location, and source
-        existing = await self.execute_query(
-            """SELECT appointment_id FROM appointments 
-                   WHERE title = ? AND scheduled_datetime = ? AND location IS ? AND source_conversation_id IS ?""",
-            (title, scheduled_datetime, location, source_conversation_id)
-        )
-        if existing:
+        digest = _content_hash(title, scheduled_datetime, location, source_conversation_id)
+        cached_id = self._dup_cache_get("appointments", digest)
+        if cached_id is not None:
             print("Skipping duplicate appointment entry.")
-            return existing[0]["appointment_id"]
-
-        await self.execute_update(
-            """INSERT INTO appointments 
-               (appointment_id, timestamp_created, scheduled_datetime, title, description, location, source_conversation_id) 
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (appointment_id, timestamp, scheduled_datetime, title, description, location, source_conversation_id)
+            return cached_id
+        rows = await self.execute_returning(
+            _UPSERT_APPOINTMENT_SQL,
+            (appointment_id, timestamp, scheduled_datetime, title, description,
+             location, source_conversation_id, digest)
         )
-        return appointment_id
+        stored_id = rows[0][0]
+        if stored_id != appointment_id:
+            print("Skipping duplicate appointment entry.")
+        self._dup_cache_put("appointments", digest, stored_id)
+        return stored_id
     
     async def create_reminder(self, content: str, due_datetime: str, 
                             priority_level: int = 5, source_conversation_id: str = None) -> str:
         """Create a new reminder with duplicate detection"""
-        reminder_id = str(uuid.uuid4())
+        reminder_id = _new_record_id()
         timestamp = get_current_timestamp()
 
         # Duplicate detection: check for existing reminder with same content, due_datetime, and source
-        existing = await self.execute_query(
-            """SELECT reminder_id FROM reminders 
-                   WHERE content = ? AND due_datetime = ? AND source_conversation_id IS ?""",
-            (content, due_datetime, source_conversation_id)
-        )
-        if existing:
+        digest = _content_hash(content, due_datetime, source_conversation_id)
+        cached_id = self._dup_cache_get("reminders", digest)
+        if cached_id is not None:
             print("Skipping duplicate reminder entry.")
-            return existing[0]["reminder_id"]
-
-        await self.execute_update(
-            """INSERT INTO reminders 
-               (reminder_id, timestamp_created, due_datetime, content, priority_level, source_conversation_id) 
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (reminder_id, timestamp, due_datetime, content, priority_level, source_conversation_id)
+            return cached_id
+        rows = await self.execute_returning(
+            _UPSERT_REMINDER_SQL,
+            (reminder_id, timestamp, due_datetime, content, priority_level,
+             source_conversation_id, digest)
         )
-        return reminder_id
+        stored_id = rows[0][0]
+        if stored_id != reminder_id:
+            print("Skipping duplicate reminder entry.")
+        self._dup_cache_put("reminders", digest, stored_id)
+        return stored_id
     
     async def get_upcoming_appointments(self, days_ahead: int = 7) -> List[Dict]:
         """Get upcoming appointments within specified days"""
@@ -1150,6 +1931,9 @@ class VSCodeProjectDatabase(DatabaseManager):
     def initialize_tables(self):
         """Create tables if they don't exist, and migrate schema if columns are missing"""
         with self.get_connection() as conn:
+            # Run all DDL in one explicit transaction - each CREATE would
+            # otherwise auto-commit (and fsync) individually
+            conn.execute("BEGIN")
             # Project sessions table migration
             sessions_expected = [
                 'session_id', 'start_timestamp', 'end_timestamp', 'workspace_path', 'active_files',
@@ -1165,7 +1949,7 @@ class VSCodeProjectDatabase(DatabaseManager):
                         break
             if needs_migration:
                 print("Migrating project_sessions table to new schema!")
-                old_rows = conn.execute("SELECT * FROM project_sessions").fetchall()
+                old_rows = _row_cursor(conn).execute("SELECT * FROM project_sessions").fetchall()
                 conn.execute("DROP TABLE IF EXISTS project_sessions")
                 conn.execute("""
                     CREATE TABLE project_sessions (
@@ -1179,15 +1963,14 @@ class VSCodeProjectDatabase(DatabaseManager):
                         created_at TEXT DEFAULT CURRENT_TIMESTAMP
                     )
                 """)
+                restored_rows = []
                 for row in old_rows:
                     row_dict = dict(row)
-                    for col in sessions_expected:
-                        if col not in row_dict:
-                            row_dict[col] = None
-                    conn.execute(
-                        f"INSERT INTO project_sessions ({', '.join(sessions_expected)}) VALUES ({', '.join(['?' for _ in sessions_expected])})",
-                        tuple(row_dict[col] for col in sessions_expected)
-                    )
+                    restored_rows.append(tuple(row_dict.get(col) for col in sessions_expected))
+                conn.executemany(
+                    f"INSERT INTO project_sessions ({', '.join(sessions_expected)}) VALUES ({', '.join(['?' for _ in sessions_expected])})",
+                    restored_rows
+                )
                 print(f"Restored {len(old_rows)} project sessions after migration.")
             else:
                 conn.execute("""
@@ -1218,7 +2001,7 @@ class VSCodeProjectDatabase(DatabaseManager):
                         break
             if needs_migration:
                 print("Migrating project_insights table to new schema!")
-                old_rows = conn.execute("SELECT * FROM project_insights").fetchall()
+                old_rows = _row_cursor(conn).execute("SELECT * FROM project_insights").fetchall()
                 conn.execute("DROP TABLE IF EXISTS project_insights")
                 conn.execute("""
                     CREATE TABLE project_insights (
@@ -1234,15 +2017,14 @@ class VSCodeProjectDatabase(DatabaseManager):
                         created_at TEXT DEFAULT CURRENT_TIMESTAMP
                     )
                 """)
+                restored_rows = []
                 for row in old_rows:
                     row_dict = dict(row)
-                    for col in insights_expected:
-                        if col not in row_dict:
-                            row_dict[col] = None
-                    conn.execute(
-                        f"INSERT INTO project_insights ({', '.join(insights_expected)}) VALUES ({', '.join(['?' for _ in insights_expected])})",
-                        tuple(row_dict[col] for col in insights_expected)
-                    )
+                    restored_rows.append(tuple(row_dict.get(col) for col in insights_expected))
+                conn.executemany(
+                    f"INSERT INTO project_insights ({', '.join(insights_expected)}) VALUES ({', '.join(['?' for _ in insights_expected])})",
+                    restored_rows
+                )
                 print(f"Restored {len(old_rows)} project insights after migration.")
             else:
                 conn.execute("""
@@ -1275,7 +2057,7 @@ class VSCodeProjectDatabase(DatabaseManager):
                         break
             if needs_migration:
                 print("Migrating code_context table to new schema!")
-                old_rows = conn.execute("SELECT * FROM code_context").fetchall()
+                old_rows = _row_cursor(conn).execute("SELECT * FROM code_context").fetchall()
                 conn.execute("DROP TABLE IF EXISTS code_context")
                 conn.execute("""
                     CREATE TABLE code_context (
@@ -1290,15 +2072,14 @@ class VSCodeProjectDatabase(DatabaseManager):
                         created_at TEXT DEFAULT CURRENT_TIMESTAMP
                     )
                 """)
+                restored_rows = []
                 for row in old_rows:
                     row_dict = dict(row)
-                    for col in codectx_expected:
-                        if col not in row_dict:
-                            row_dict[col] = None
-                    conn.execute(
-                        f"INSERT INTO code_context ({', '.join(codectx_expected)}) VALUES ({', '.join(['?' for _ in codectx_expected])})",
-                        tuple(row_dict[col] for col in codectx_expected)
-                    )
+                    restored_rows.append(tuple(row_dict.get(col) for col in codectx_expected))
+                conn.executemany(
+                    f"INSERT INTO code_context ({', '.join(codectx_expected)}) VALUES ({', '.join(['?' for _ in codectx_expected])})",
+                    restored_rows
+                )
                 print(f"Restored {len(old_rows)} code contexts after migration.")
             else:
                 conn.execute("""
@@ -1330,7 +2111,7 @@ class VSCodeProjectDatabase(DatabaseManager):
                         break
             if needs_migration:
                 print("Migrating development_conversations table to new schema!")
-                old_rows = conn.execute("SELECT * FROM development_conversations").fetchall()
+                old_rows = _row_cursor(conn).execute("SELECT * FROM development_conversations").fetchall()
                 conn.execute("DROP TABLE IF EXISTS development_conversations")
                 conn.execute("""
                     CREATE TABLE development_conversations (
@@ -1346,15 +2127,14 @@ class VSCodeProjectDatabase(DatabaseManager):
                         FOREIGN KEY (session_id) REFERENCES project_sessions (session_id)
                     )
                 """)
+                restored_rows = []
                 for row in old_rows:
                     row_dict = dict(row)
-                    for col in devcon_expected:
-                        if col not in row_dict:
-                            row_dict[col] = None
-                    conn.execute(
-                        f"INSERT INTO development_conversations ({', '.join(devcon_expected)}) VALUES ({', '.join(['?' for _ in devcon_expected])})",
-                        tuple(row_dict[col] for col in devcon_expected)
-                    )
+                    restored_rows.append(tuple(row_dict.get(col) for col in devcon_expected))
+                conn.executemany(
+                    f"INSERT INTO development_conversations ({', '.join(devcon_expected)}) VALUES ({', '.join(['?' for _ in devcon_expected])})",
+                    restored_rows
+                )
                 print(f"Restored {len(old_rows)} development conversations after migration.")
             else:
                 conn.execute("""
@@ -1372,21 +2152,24 @@ class VSCodeProjectDatabase(DatabaseManager):
                     )
                 """)
 
+            # Hash-backed duplicate detection (single B-tree probe per insert)
+            self._ensure_hash_column(
+                conn, "project_insights",
+                ("content", "insight_type", "source_conversation_id"))
+
             conn.commit()
     
     async def save_development_session(self, workspace_path: str, active_files: List[str] = None,
                                      git_branch: str = None, session_summary: str = None) -> str:
         """Save a development session"""
         
-        session_id = str(uuid.uuid4())
+        session_id = _new_record_id()
         timestamp = get_current_timestamp()
         
         await self.execute_update(
-            """INSERT INTO project_sessions 
-               (session_id, start_timestamp, workspace_path, active_files, git_branch, session_summary) 
-               VALUES (?, ?, ?, ?, ?, ?)""",
+            _INSERT_PROJECT_SESSION_SQL,
             (session_id, timestamp, workspace_path, 
-             json.dumps(active_files) if active_files else None,
+             _json_dumps(active_files) if active_files is not None else None,
              git_branch, session_summary)
         )
         
@@ -1404,7 +2187,7 @@ class VSCodeProjectDatabase(DatabaseManager):
             decisions_made: Summary of decisions made in conversation
             code_changes: Dictionary of files changed and their changes
         """
-        conversation_id = str(uuid.uuid4())
+        conversation_id = _new_record_id()
         timestamp = get_current_timestamp()
         
         # Create session if none provided
@@ -1416,12 +2199,9 @@ class VSCodeProjectDatabase(DatabaseManager):
         
         # Store conversation
         await self.execute_update(
-            """INSERT INTO development_conversations 
-               (conversation_id, session_id, timestamp, chat_context_id,
-                conversation_content, decisions_made, code_changes)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            _INSERT_DEV_CONVERSATION_SQL,
             (conversation_id, session_id, timestamp, chat_context_id,
-             content, decisions_made, json.dumps(code_changes) if code_changes else None)
+             content, decisions_made, _json_dumps(code_changes) if code_changes is not None else None)
         )
         
         return conversation_id
@@ -1430,29 +2210,28 @@ class VSCodeProjectDatabase(DatabaseManager):
                                   related_files: List[str] = None, importance_level: int = 5,
                                   source_conversation_id: str = None) -> str:
         """Store a project insight with duplicate detection"""
-        insight_id = str(uuid.uuid4())
+        insight_id = _new_record_id()
         timestamp = get_current_timestamp()
 
-        # Duplicate detection: check for existing insight with same content, type, and source
-        existing = await self.execute_query(
-            """SELECT insight_id FROM project_insights 
-                   WHERE content = ? AND insight_type IS ? AND source_conversation_id IS ?""",
-            (content, insight_type, source_conversation_id)
-        )
-        if existing:
+        # Duplicate detection is handled by the UNIQUE content_hash index
+        # inside the INSERT itself; the in-process LRU short-circuits
+        # repeats before any SQL happens
+        digest = _content_hash(content, insight_type, source_conversation_id)
+        cached_id = self._dup_cache_get("project_insights", digest)
+        if cached_id is not None:
             print("Skipping duplicate project insight entry.")
-            return existing[0]["insight_id"]
-
-        await self.execute_update(
-            """INSERT INTO project_insights 
-               (insight_id, timestamp_created, timestamp_updated, insight_type, content, 
-                related_files, source_conversation_id, importance_level) 
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            return cached_id
+        rows = await self.execute_returning(
+            _UPSERT_PROJECT_INSIGHT_SQL,
             (insight_id, timestamp, timestamp, insight_type, content,
-             json.dumps(related_files) if related_files else None,
-             source_conversation_id, importance_level)
+             _json_dumps(related_files) if related_files is not None else None,
+             source_conversation_id, importance_level, digest)
         )
-        return insight_id
+        stored_id = rows[0][0]
+        if stored_id != insight_id:
+            print("Skipping duplicate project insight entry.")
+        self._dup_cache_put("project_insights", digest, stored_id)
+        return stored_id
 
 
 class ConversationFileMonitor:
@@ -1514,7 +2293,13 @@ class ConversationFileMonitor:
         self.mcp_port = mcp_port  # Port to check for MCP server
         self.mcp_server_running = False  # Will be updated periodically
         self.last_mcp_check = 0  # Timestamp of last MCP server check
-        
+        # Chat exports can be multi-megabyte JSON blobs; parsing them on
+        # the event loop would stall every in-flight DB coroutine, so the
+        # read+parse step runs on this pool instead
+        self._parse_executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 2, thread_name_prefix="conv-parse"
+        )
+
     def _get_default_chat_directories(self) -> List[str]:
         """Get default chat storage directories for different platforms"""
         home = Path.home()
@@ -1869,6 +2654,17 @@ class ConversationFileMonitor:
             return str(hash(file_path))
     
     async def _extract_conversations(self, file_path: str) -> List[Dict]:
+        """Extract conversations from a file without blocking the event loop.
+
+        The actual file read and format parsing are synchronous CPU/IO work,
+        so they run on the monitor's parse pool via run_in_executor.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._parse_executor, self._extract_conversations_sync, file_path
+        )
+
+    def _extract_conversations_sync(self, file_path: str) -> List[Dict]:
         """Extract conversations from various file formats with timestamps, using registry-based extensibility and robust deduplication"""
         conversations = []
         try:
@@ -2702,17 +3498,29 @@ class EmbeddingService:
 class PersistentAIMemorySystem:
     """Main memory system that coordinates all databases and operations - FULL FEATURED VERSION"""
     
-    def __init__(self, data_dir: str = "memory_data", enable_file_monitoring: bool = True, 
-                 watch_directories: List[str] = None):
+    def __init__(self, data_dir: str = "memory_data", enable_file_monitoring: bool = True,
+                 watch_directories: List[str] = None, single_database: bool = False):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
-        
-        # Initialize all 5 databases
-        self.conversations_db = ConversationDatabase(str(self.data_dir / "conversations.db"))
-        self.ai_memory_db = AIMemoryDatabase(str(self.data_dir / "ai_memories.db"))
-        self.schedule_db = ScheduleDatabase(str(self.data_dir / "schedule.db"))
-        self.vscode_db = VSCodeProjectDatabase(str(self.data_dir / "vscode_project.db"))
-        self.mcp_db = MCPToolCallDatabase(str(self.data_dir / "mcp_tool_calls.db"))
+
+        # Initialize all 5 databases. With single_database=True all five
+        # schemas live in one file (their table names are disjoint), sharing
+        # one WAL and lock region instead of five - fewer fsyncs and file
+        # handles for cross-database workloads. The default stays one file
+        # per database so existing installs keep reading their data.
+        if single_database:
+            shared_path = str(self.data_dir / "memory.db")
+            self.conversations_db = ConversationDatabase(shared_path)
+            self.ai_memory_db = AIMemoryDatabase(shared_path)
+            self.schedule_db = ScheduleDatabase(shared_path)
+            self.vscode_db = VSCodeProjectDatabase(shared_path)
+            self.mcp_db = MCPToolCallDatabase(shared_path)
+        else:
+            self.conversations_db = ConversationDatabase(str(self.data_dir / "conversations.db"))
+            self.ai_memory_db = AIMemoryDatabase(str(self.data_dir / "ai_memories.db"))
+            self.schedule_db = ScheduleDatabase(str(self.data_dir / "schedule.db"))
+            self.vscode_db = VSCodeProjectDatabase(str(self.data_dir / "vscode_project.db"))
+            self.mcp_db = MCPToolCallDatabase(str(self.data_dir / "mcp_tool_calls.db"))
         
         # Initialize embedding service with user-configurable options
         self.embedding_service = EmbeddingService.create_with_user_config()
@@ -2766,30 +3574,18 @@ class PersistentAIMemorySystem:
     async def get_conversation_history(self, limit: int = 20, session_id: str = None) -> List[Dict]:
         """Get recent conversation history"""
         
-        messages = await self.conversations_db.get_recent_messages(limit, session_id)
-        return [dict(msg) for msg in messages]
+        # get_recent_messages already materialized plain dicts; re-wrapping
+        # them allocated a second dict per row for nothing
+        return await self.conversations_db.get_recent_messages(limit, session_id)
 
     async def get_recent_context(self, limit: int = 10, session_id: str = None) -> Dict:
         """Retrieve recent conversation context, optionally filtered by session."""
         try:
             if session_id:
-                query = """
-                    SELECT m.*, c.session_id 
-                    FROM messages m 
-                    JOIN conversations c ON m.conversation_id = c.conversation_id
-                    WHERE c.session_id = ?
-                    ORDER BY m.timestamp DESC 
-                    LIMIT ?
-                """
+                query = _SELECT_RECENT_MESSAGES_BY_SESSION_SQL
                 params = (session_id, limit)
             else:
-                query = """
-                    SELECT m.*, c.session_id 
-                    FROM messages m 
-                    JOIN conversations c ON m.conversation_id = c.conversation_id
-                    ORDER BY m.timestamp DESC 
-                    LIMIT ?
-                """
+                query = _SELECT_RECENT_MESSAGES_SQL
                 params = (limit,)
 
             rows = await self.conversations_db.execute_query(query, params)
@@ -2984,7 +3780,7 @@ class PersistentAIMemorySystem:
         Returns:
             Dict containing the created context link
         """
-        context_id = str(uuid.uuid4())
+        context_id = _new_record_id()
         timestamp = get_current_timestamp()
         
         await self.vscode_db.execute_update(
@@ -3684,7 +4480,7 @@ class PersistentAIMemorySystem:
         try:
             embedding = await self.embedding_service.generate_embedding(content)
             if embedding:
-                embedding_blob = np.array(embedding, dtype=np.float32).tobytes()
+                embedding_blob = memoryview(np.array(embedding, dtype=np.float32).tobytes())
                 await self.conversations_db.execute_update(
                     "UPDATE messages SET embedding = ? WHERE message_id = ?",
                     (embedding_blob, message_id)
@@ -3697,7 +4493,7 @@ class PersistentAIMemorySystem:
         try:
             embedding = await self.embedding_service.generate_embedding(content)
             if embedding:
-                embedding_blob = np.array(embedding, dtype=np.float32).tobytes()
+                embedding_blob = memoryview(np.array(embedding, dtype=np.float32).tobytes())
                 await self.ai_memory_db.execute_update(
                     "UPDATE curated_memories SET embedding = ? WHERE memory_id = ?",
                     (embedding_blob, memory_id)
@@ -3710,7 +4506,7 @@ class PersistentAIMemorySystem:
         try:
             embedding = await self.embedding_service.generate_embedding(content)
             if embedding:
-                embedding_blob = np.array(embedding, dtype=np.float32).tobytes()
+                embedding_blob = memoryview(np.array(embedding, dtype=np.float32).tobytes())
                 await self.schedule_db.execute_update(
                     "UPDATE appointments SET embedding = ? WHERE appointment_id = ?",
                     (embedding_blob, appointment_id)
@@ -3723,7 +4519,7 @@ class PersistentAIMemorySystem:
         try:
             embedding = await self.embedding_service.generate_embedding(content)
             if embedding:
-                embedding_blob = np.array(embedding, dtype=np.float32).tobytes()
+                embedding_blob = memoryview(np.array(embedding, dtype=np.float32).tobytes())
                 await self.schedule_db.execute_update(
                     "UPDATE reminders SET embedding = ? WHERE reminder_id = ?",
                     (embedding_blob, reminder_id)
@@ -3736,7 +4532,7 @@ class PersistentAIMemorySystem:
         try:
             embedding = await self.embedding_service.generate_embedding(content)
             if embedding:
-                embedding_blob = np.array(embedding, dtype=np.float32).tobytes()
+                embedding_blob = memoryview(np.array(embedding, dtype=np.float32).tobytes())
                 await self.vscode_db.execute_update(
                     "UPDATE project_insights SET embedding = ? WHERE insight_id = ?",
                     (embedding_blob, insight_id)
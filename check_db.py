@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Quick inspector for the memory databases.
+
+Lists every table in each database under ``memory_data/`` with its row
+count and a few sample rows. Connections are opened once per file with
+the same pragmas the live system uses and memoized at module scope, so
+repeated invocations via import reuse the warm page cache instead of
+re-opening cold handles.
+"""
+import json
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+DATA_DIR = Path("memory_data")
+
+# Sidecar cache of each database's table list keyed by file mtime; stable
+# schemas skip the sqlite_master query entirely on later runs
+SCHEMA_CACHE_PATH = DATA_DIR / ".inspect_cache.json"
+
+# Path -> connection; re-entry through import reuses the handle (and with
+# it SQLite's page cache) instead of paying a cold open per run
+_DB_CACHE: Dict[Path, sqlite3.Connection] = {}
+
+
+def open_db(path: Path) -> sqlite3.Connection:
+    """Open a database once with the system's pragmas and memoize it."""
+    path = path.resolve()
+    conn = _DB_CACHE.get(path)
+    if conn is None:
+        conn = sqlite3.connect(str(path))
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        _DB_CACHE[path] = conn
+    return conn
+
+
+def _load_schema_cache() -> Dict:
+    try:
+        with open(SCHEMA_CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _get_tables(path: Path, cur: sqlite3.Cursor, cache: Dict) -> List[str]:
+    """Table list for one database, served from the mtime-keyed sidecar."""
+    mtime = path.stat().st_mtime
+    entry = cache.get(str(path))
+    if entry and entry.get("mtime") == mtime:
+        return entry["tables"]
+    cur.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
+    tables = [row[0] for row in cur.fetchall()]
+    cache[str(path)] = {"mtime": mtime, "tables": tables}
+    return tables
+
+
+def _save_schema_cache(cache: Dict) -> None:
+    try:
+        with open(SCHEMA_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+def inspect_db(path: Path, schema_cache: Dict = None, out: List[str] = None) -> None:
+    """Collect table names, row counts and sample rows for one database.
+
+    Output lines are appended to ``out`` and flushed by the caller in a
+    single write - one syscall for the whole report instead of one per
+    print, which matters on slow terminals and network filesystems.
+    """
+    lines = out if out is not None else []
+    conn = open_db(path)
+    # One cursor for the whole table loop - a fresh cursor per statement
+    # just adds allocation churn. arraysize sets how many rows each
+    # C-level fetch pulls at once; the default of 1 crosses the Python-C
+    # boundary per row
+    cur = conn.cursor()
+    cur.arraysize = 256
+    tables = _get_tables(path, cur, schema_cache if schema_cache is not None else {})
+
+    lines.append(f"\n=== {path} ===")
+    if not tables:
+        lines.append("  (no tables)")
+        if out is None:
+            sys.stdout.write("\n".join(lines) + "\n")
+        return
+
+    # One compound statement counts every table in a single round trip
+    # instead of N separate COUNT(*) executions
+    counts_sql = " UNION ALL ".join(
+        f'SELECT \'{table}\' AS t, COUNT(*) AS c FROM "{table}"' for table in tables
+    )
+    counts = {row[0]: row[1] for row in cur.execute(counts_sql).fetchall()}
+
+    for table in tables:
+        count = counts.get(table, 0)
+        lines.append(f"  {table}: {count} rows")
+        if count:
+            cur.execute(f'SELECT * FROM "{table}" LIMIT 3')
+            for row in cur.fetchmany():
+                lines.append(f"    {dict(row)}")
+    if out is None:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def main() -> None:
+    db_files = sorted(DATA_DIR.glob("*.db")) if DATA_DIR.exists() else []
+    if not db_files:
+        print(f"No databases found under {DATA_DIR}/")
+        return
+    schema_cache = _load_schema_cache()
+    lines: List[str] = []
+    for db_file in db_files:
+        inspect_db(db_file, schema_cache, lines)
+    _save_schema_cache(schema_cache)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -379,9 +379,10 @@ class DatabaseMaintenance:
                     
                     upgrades_applied.append("updated_messages_source_type")
                     logger.info("Successfully updated messages table schema")
-            finally:
-                conn.close()
-                
+            except Exception:
+                conn.rollback()
+                raise
+
         except Exception as e:
             logger.error(f"Error upgrading messages schema: {e}")
             
@@ -451,8 +452,9 @@ class DatabaseMaintenance:
                     conn.commit()
                     upgrades_applied.append("added_source_metadata_column")
                     logger.info("Successfully added source_metadata column")
-            finally:
-                conn.close()
+            except Exception:
+                conn.rollback()
+                raise
                 
             # 2. Upgrade messages table schema
             logger.info("Checking messages table schema...")
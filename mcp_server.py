@@ -17,6 +17,23 @@ class PersistentAIMemoryMCPServer:
 
     def __init__(self):
         self.memory_system = PersistentAIMemorySystem()
+        # Fire-and-forget log queue; logging is best-effort, so it should
+        # not add a DB write to every response's latency. Created lazily so
+        # the queue binds to the running event loop.
+        self._log_queue = None
+        self._log_loop = None
+        self._log_task = None
+        self._method_cache: Dict[str, Any] = {}
+        # Tool name -> handler, built once so dispatch is a single dict
+        # lookup instead of a chain of string compares per request
+        self._handlers = {
+            "store_memory": self._handle_create_memory,
+            "create_memory": self._handle_create_memory,
+            "search_memories": self._handle_search_memories,
+            "get_system_health": self._handle_get_system_health,
+            "get_tool_call_history": self._handle_get_tool_call_history,
+            "store_conversation": self._handle_store_conversation,
+        }
 
     async def _log_call(self, tool_name: str, parameters: Optional[Dict] = None,
                         execution_time_ms: Optional[float] = None, status: str = "success",
@@ -37,69 +54,123 @@ class PersistentAIMemoryMCPServer:
             # best-effort logging in tests
             pass
 
+    _LOG_QUEUE_MAX = 10_000
+
+    def _enqueue_log(self, *log_args):
+        """Queue a tool-call log without blocking the response path.
+
+        On overflow the oldest entry is dropped - the logs are best-effort
+        diagnostics and stalling live requests for them is the wrong trade.
+        """
+        loop = asyncio.get_running_loop()
+        if self._log_queue is None or self._log_loop is not loop:
+            self._log_queue = asyncio.Queue(maxsize=self._LOG_QUEUE_MAX)
+            self._log_loop = loop
+            self._log_task = loop.create_task(self._log_consumer())
+        try:
+            self._log_queue.put_nowait(log_args)
+        except asyncio.QueueFull:
+            try:
+                self._log_queue.get_nowait()
+                self._log_queue.task_done()
+                self._log_queue.put_nowait(log_args)
+            except (asyncio.QueueEmpty, asyncio.QueueFull):
+                pass
+
+    async def _log_consumer(self):
+        while True:
+            log_args = await self._log_queue.get()
+            try:
+                await self._log_call(*log_args)
+            finally:
+                self._log_queue.task_done()
+
+    async def _flush_logs(self):
+        """Wait for queued logs to land (used before reading history)"""
+        if self._log_queue is not None and self._log_loop is asyncio.get_running_loop():
+            await self._log_queue.join()
+
     async def _call_method(self, method_name: str, *args, **kwargs):
-        method = getattr(self.memory_system, method_name, None)
-        if method is None or not asyncio.iscoroutinefunction(method):
-            raise AttributeError(f"Method {method_name} not available on memory system")
+        # Bound methods are stable after init, so resolve each name once;
+        # the iscoroutinefunction probe (which walks __wrapped__ chains) is
+        # dropped - awaiting a non-coroutine raises just as loudly
+        method = self._method_cache.get(method_name)
+        if method is None:
+            method = getattr(self.memory_system, method_name, None)
+            if method is None:
+                raise AttributeError(f"Method {method_name} not available on memory system")
+            self._method_cache[method_name] = method
         return await method(*args, **kwargs)
 
+    async def _handle_create_memory(self, tool: str, params: Dict, client_id: Optional[str]):
+        content = params.get("content") or params.get("memory_content")
+        memory_type = params.get("memory_type")
+        importance = params.get("importance_level", 5)
+        tags = params.get("tags")
+        res = await self._call_method(
+            "create_memory",
+            content,
+            memory_type,
+            importance,
+            tags,
+            params.get("source_conversation_id"),
+        )
+        self._enqueue_log(tool, params, None, "success", res, None, client_id)
+        return {"status": "success", "result": res}
+
+    async def _handle_search_memories(self, tool: str, params: Dict, client_id: Optional[str]):
+        query = params.get("query")
+        limit = params.get("limit", 10)
+        res = await self._call_method("search_memories", query, limit)
+        self._enqueue_log(tool, params, None, "success", res, None, client_id)
+        return {"status": "success", "result": res}
+
+    async def _handle_get_system_health(self, tool: str, params: Dict, client_id: Optional[str]):
+        res = await self._call_method("get_system_health")
+        self._enqueue_log(tool, params, None, "success", res, None, client_id)
+        return {"status": "success", "result": res}
+
+    async def _handle_get_tool_call_history(self, tool: str, params: Dict, client_id: Optional[str]):
+        limit = params.get("limit", 50)
+        # History must reflect calls whose logs are still queued
+        await self._flush_logs()
+        rows = []
+        try:
+            if hasattr(self.memory_system, "mcp_db") and hasattr(self.memory_system.mcp_db, "get_tool_call_history"):
+                rows = await self.memory_system.mcp_db.get_tool_call_history(limit=limit)
+        except Exception:
+            rows = []
+        self._enqueue_log(tool, params, None, "success", {"history_count": len(rows)}, None, client_id)
+        return {"status": "success", "result": {"history": rows}}
+
+    async def _handle_store_conversation(self, tool: str, params: Dict, client_id: Optional[str]):
+        content = params.get("user_message") or params.get("content")
+        assistant = params.get("assistant_response")
+        session_id = params.get("session_id")
+        if assistant:
+            # The two messages are independent inserts - run them
+            # concurrently so their duplicate-detection SELECTs overlap on
+            # the reader pool while the writer lane serializes the INSERTs
+            msg1, _ = await asyncio.gather(
+                self._call_method("store_conversation", content, "user", session_id, None, params.get("metadata")),
+                self._call_method("store_conversation", assistant, "assistant", session_id, None, params.get("metadata")),
+            )
+        else:
+            msg1 = await self._call_method("store_conversation", content, "user", session_id, None, params.get("metadata"))
+        conversation_id = msg1.get('conversation_id') if isinstance(msg1, dict) else None
+        self._enqueue_log(tool, params, None, "success", {"conversation_id": conversation_id}, None, client_id)
+        return {"status": "success", "result": {"conversation_id": conversation_id}}
+
     async def handle_mcp_request(self, request: Dict[str, Any], client_id: Optional[str] = None) -> Dict[str, Any]:
         tool = request.get("tool")
         params = request.get("parameters") or {}
 
-        try:
-            if tool in ("store_memory", "create_memory"):
-                content = params.get("content") or params.get("memory_content")
-                memory_type = params.get("memory_type")
-                importance = params.get("importance_level", 5)
-                tags = params.get("tags")
-                res = await self._call_method(
-                    "create_memory",
-                    content,
-                    memory_type,
-                    importance,
-                    tags,
-                    params.get("source_conversation_id"),
-                )
-                await self._log_call(tool, params, execution_time_ms=None, status="success", result=res, client_id=client_id)
-                return {"status": "success", "result": res}
-
-            if tool == "search_memories":
-                query = params.get("query")
-                limit = params.get("limit", 10)
-                res = await self._call_method("search_memories", query, limit)
-                await self._log_call(tool, params, execution_time_ms=None, status="success", result=res, client_id=client_id)
-                return {"status": "success", "result": res}
-
-            if tool == "get_system_health":
-                res = await self._call_method("get_system_health")
-                await self._log_call(tool, params, execution_time_ms=None, status="success", result=res, client_id=client_id)
-                return {"status": "success", "result": res}
-
-            if tool == "get_tool_call_history":
-                limit = params.get("limit", 50)
-                rows = []
-                try:
-                    if hasattr(self.memory_system, "mcp_db") and hasattr(self.memory_system.mcp_db, "get_tool_call_history"):
-                        rows = await self.memory_system.mcp_db.get_tool_call_history(limit=limit)
-                except Exception:
-                    rows = []
-                await self._log_call(tool, params, execution_time_ms=None, status="success", result={"history_count": len(rows)}, client_id=client_id)
-                return {"status": "success", "result": {"history": rows}}
-
-            if tool == "store_conversation":
-                content = params.get("user_message") or params.get("content")
-                assistant = params.get("assistant_response")
-                session_id = params.get("session_id")
-                msg1 = await self._call_method("store_conversation", content, "user", session_id, None, params.get("metadata"))
-                if assistant:
-                    await self._call_method("store_conversation", assistant, "assistant", session_id, None, params.get("metadata"))
-                await self._log_call(tool, params, execution_time_ms=None, status="success", result={"conversation_id": msg1.get('conversation_id') if isinstance(msg1, dict) else None}, client_id=client_id)
-                return {"status": "success", "result": {"conversation_id": msg1.get('conversation_id') if isinstance(msg1, dict) else None}}
-
-            # default: unknown tool
+        handler = self._handlers.get(tool)
+        if handler is None:
             return {"status": "error", "error": f"Unknown tool: {tool}"}
 
+        try:
+            return await handler(tool, params, client_id)
         except Exception as e:
-            await self._log_call(tool or "unknown", params, execution_time_ms=None, status="error", error_message=str(e), client_id=client_id)
+            self._enqueue_log(tool or "unknown", params, None, "error", None, str(e), client_id)
             return {"status": "error", "error": str(e)}
@@ -1,11 +1,39 @@
-import sys, pathlib, asyncio
+import sys, pathlib, asyncio, sqlite3
 sys.path.insert(0, str(pathlib.Path('.').resolve()))
 from ai_memory_core import PersistentAIMemorySystem
 
+def check_database_integrity(data_dir='memory_data'):
+    """Run PRAGMA quick_check on every database file under data_dir.
+
+    quick_check skips the slow index-content verification of a full
+    integrity_check but still catches page-level corruption. On failure a
+    wal_checkpoint(TRUNCATE) is attempted, which repairs the common case of
+    a stale or torn WAL left by an unclean shutdown.
+    """
+    ok = True
+    for db_file in sorted(pathlib.Path(data_dir).glob('*.db')):
+        try:
+            conn = sqlite3.connect(str(db_file))
+            result = conn.execute('PRAGMA quick_check').fetchone()[0]
+            if result != 'ok':
+                ok = False
+                print(f'integrity {db_file.name}: FAILED ({result})')
+                conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+                result = conn.execute('PRAGMA quick_check').fetchone()[0]
+                print(f'integrity {db_file.name}: after checkpoint: {result}')
+            else:
+                print(f'integrity {db_file.name}: ok')
+            conn.close()
+        except sqlite3.Error as e:
+            ok = False
+            print(f'integrity {db_file.name}: ERROR ({e})')
+    return ok
+
 async def main():
     ms = PersistentAIMemorySystem(enable_file_monitoring=False)
     health = await ms.get_system_health()
     print('embedding endpoint:', health.get('embedding_service', {}).get('endpoint'))
+    check_database_integrity()
 
 if __name__ == '__main__':
     asyncio.run(main())
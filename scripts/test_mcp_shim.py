@@ -7,6 +7,12 @@ ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from mcp_server_clean import PersistentAIMemoryMCPServer
 
 
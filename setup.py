@@ -25,22 +25,27 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
+        "Programming Language :: Python :: 3.12",
         "Topic :: Scientific/Engineering :: Artificial Intelligence",
         "Topic :: Database :: Database Engines/Servers",
         "Topic :: Software Development :: Libraries :: Python Modules",
         "Topic :: Software Development :: Version Control :: Git",
     ],
-    python_requires=">=3.8",
+    # 3.11+ gives us the fast datetime.fromisoformat path and modern sqlite3
+    # features the hot paths rely on
+    python_requires=">=3.11",
     install_requires=[
         "aiohttp>=3.8.0",
         "watchdog>=2.1.0",
         "numpy>=1.21.0",
     ],
     extras_require={
+        "performance": [
+            "orjson>=3.9",
+            "ciso8601>=2.3",
+            "uvloop>=0.19; sys_platform != 'win32'",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-asyncio>=0.18.0",
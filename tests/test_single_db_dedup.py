@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Regression test: in single-database mode every record type shares one
+database file (and with it one duplicate-fingerprint cache), so identical
+key fields across different tables must not be mistaken for duplicates.
+"""
+
+import asyncio
+import shutil
+import tempfile
+from pathlib import Path
+
+
+async def test_single_db_cross_table_dedup():
+    """Same content in two tables must yield two distinct records"""
+
+    test_dir = Path(tempfile.mkdtemp(prefix="ai_memory_test_"))
+
+    try:
+        from ai_memory_core import PersistentAIMemorySystem
+
+        memory_system = PersistentAIMemorySystem(
+            data_dir=str(test_dir / "memory_data"),
+            enable_file_monitoring=False,
+            single_database=True,
+        )
+
+        # Both records hash the same key fields (content, None, None); the
+        # shared cache must still treat them as different record types
+        shared_content = "Shared content across record types"
+        memory_id = await memory_system.ai_memory_db.create_memory(shared_content)
+        insight_id = await memory_system.vscode_db.store_project_insight(shared_content)
+
+        assert insight_id != memory_id, (
+            "project insight resolved to the curated memory's id"
+        )
+
+        insights = await memory_system.vscode_db.execute_query(
+            "SELECT insight_id FROM project_insights", ()
+        )
+        assert [row["insight_id"] for row in insights] == [insight_id], (
+            "project insight row was not stored"
+        )
+
+        # Genuine duplicates within one table are still collapsed
+        repeat_id = await memory_system.ai_memory_db.create_memory(shared_content)
+        assert repeat_id == memory_id
+
+        print("✅ Cross-table dedup keeps records distinct in single-database mode")
+
+    finally:
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(test_single_db_cross_table_dedup())